@@ -22,6 +22,7 @@ class Settings:
     GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
     GITHUB_API_URL = 'https://api.github.com'
     GITHUB_ORG = os.getenv('GITHUB_ORG', 'greenwhite')
+    GITHUB_TIMEOUT = int(os.getenv('GITHUB_TIMEOUT', 30))  # HTTP so'rov timeout (sekund)
 
     # ==================== Gemini AI ====================
     GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
@@ -205,8 +205,8 @@ class PRHelper:
         """
         PR fayllariga Smart Patch qo'llash - UNIVERSAL METHOD
 
-        Bu method SmartPatchHelper.get_file_content() ishlatadi
-        (TZ-PR Service bilan bir xil!)
+        Bu method SmartPatchHelper.get_file_contents_batch() ishlatadi
+        (get_file_content() bilan bir xil, fayllar parallel olinadi)
 
         Args:
             pr_files: PR files list
@@ -217,19 +217,24 @@ class PRHelper:
         """
         enriched_files = []
 
+        # Smart Patch kerak bo'lgan fayllar kontenti parallel olinadi
+        smart_files = [
+            file_data for file_data in pr_files
+            if SmartPatchConfig.should_use_smart_patch(file_data.get('filename', ''), len(pr_files))
+        ]
+        # Xato bo'lgan fayl uchun None (batch har bir faylni alohida ushlaydi)
+        contents = SmartPatchHelper.get_file_contents_batch(pr, smart_files, self.github)
+        full_contents = {id(file_data): content for file_data, content in zip(smart_files, contents)}
+
         for file_data in pr_files:
             filename = file_data.get('filename', '')
             patch = file_data.get('patch', '')
 
             # Smart Patch qo'llash kerakmi?
-            if SmartPatchConfig.should_use_smart_patch(filename, len(pr_files)):
+            if id(file_data) in full_contents:
                 try:
                     # UNIVERSAL method - 3 xil usul
-                    full_content = SmartPatchHelper.get_file_content(
-                        pr,
-                        file_data,
-                        self.github.session
-                    )
+                    full_content = full_contents[id(file_data)]
 
                     if full_content:
                         # Smart context yaratish
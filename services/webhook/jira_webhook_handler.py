@@ -62,7 +62,10 @@ from utils.database.task_db import (
     set_service1_error,
     set_service2_done,
     set_service2_error,
-    reset_service_statuses
+    reset_service_statuses,
+    transaction,
+    ensure_initialized,
+    get_stuck_tasks
 )
 
 # ============================================================================
@@ -273,9 +276,11 @@ async def jira_webhook(
             mark_progressing(task_key, new_status, datetime.now())
             logger.info(f"[{task_key}] ✅ DB: mark_progressing (status: {task_status} → progressing)")
         elif task_status == 'returned':
-            increment_return_count(task_key)
-            reset_service_statuses(task_key)  # ✅ Service statuslarni qayta boshlash
-            mark_progressing(task_key, new_status, datetime.now())
+            # Bitta tranzaksiya - bitta commit
+            with transaction() as conn:
+                increment_return_count(task_key, conn=conn)
+                reset_service_statuses(task_key, conn=conn)  # ✅ Service statuslarni qayta boshlash
+                mark_progressing(task_key, new_status, datetime.now(), conn=conn)
             new_return_count = get_task(task_key).get('return_count', 0) if get_task(task_key) else 0
             logger.info(f"[{task_key}] ✅ DB: returned → progressing, return_count: {return_count} → {new_return_count}, services reset")
         elif task_status == 'progressing':
@@ -298,8 +303,9 @@ async def jira_webhook(
                 logger.info(f"[{task_key}] ⏭️ Skip code '{skip_code}' topildi, Service1 bekor, Service2 run")
 
                 # Mark Service1 as done (100% to skip compliance check)
-                set_service1_done(task_key, compliance_score=100)
-                set_skip_detected(task_key)
+                with transaction() as conn:
+                    set_service1_done(task_key, compliance_score=100, conn=conn)
+                    set_skip_detected(task_key, conn=conn)
 
                 # Write skip notification
                 adf_formatter = get_adf_formatter()
@@ -852,8 +858,9 @@ async def _run_testcase_generation(task_key: str, new_status: str):
         success, message = await check_and_generate_testcases(task_key, new_status)
 
         if success:
-            set_service2_done(task_key)
-            mark_completed(task_key)
+            with transaction() as conn:
+                set_service2_done(task_key, conn=conn)
+                mark_completed(task_key, conn=conn)
             logger.info(f"[{task_key}] ✅ Service2 done: {message}")
         else:
             error_msg = f"Testcase generation failed: {message}"
@@ -1262,6 +1269,12 @@ async def health_check():
     except Exception as e:
         health["services"]["settings"] = f"error: {str(e)}"
 
+    # 'progressing' holatida qotib qolgan tasklar (webhook ularni qayta ishlamaydi)
+    stuck = get_stuck_tasks()
+    health["stuck_tasks"] = [t.task_id for t in stuck]
+    if stuck:
+        health["status"] = "degraded" if health["status"] == "healthy" else health["status"]
+
     return health
 
 
@@ -1364,6 +1377,9 @@ async def startup_event():
     app_settings = get_app_settings(force_reload=True)
     settings = app_settings.tz_pr_checker
 
+    # DB ni oldindan tayyorlash (birinchi webhook kutmasligi uchun)
+    ensure_initialized()
+
     logger.info("=" * 80)
     logger.info("JIRA TZ-PR Auto Checker v2.0 Started")
     logger.info("=" * 80)
@@ -1378,6 +1394,13 @@ async def startup_event():
     logger.info(f"  - Trigger Status: {settings.trigger_status}")
     logger.info("=" * 80)
 
+    stuck = get_stuck_tasks()
+    if stuck:
+        logger.warning(
+            f"{len(stuck)} ta task 'progressing' holatida qolgan: "
+            f"{', '.join(t.task_id for t in stuck)}"
+        )
+
 
 # ============================================================================
 # MAIN
@@ -659,10 +659,11 @@ def test_4_database_operations():
             increment_return_count, set_skip_detected,
             set_service1_done, set_service1_error,
             set_service2_done, set_service2_error,
-            reset_service_statuses, DB_FILE
+            reset_service_statuses, ensure_initialized, DB_FILE
         )
 
-        # 4.1 DB fayl mavjud
+        # 4.1 DB fayl mavjud (import paytida emas, lazy yaratiladi)
+        ensure_initialized()
         if os.path.exists(DB_FILE):
             tracker.ok(f"DB fayl mavjud: {DB_FILE}")
         else:
@@ -814,19 +815,33 @@ def test_4_database_operations():
         else:
             tracker.fail("updated_at", "Topilmadi")
 
-        # 4.15 Indexlar mavjudligi
+        # 4.15 get_stuck_tasks() - progressing holatida qolgan tasklar
+        from utils.database.task_db import get_stuck_tasks
+        stuck_ids = {t.task_id for t in get_stuck_tasks(older_than_minutes=0)}
+        if test_key3 not in stuck_ids and test_key6 not in stuck_ids:
+            tracker.ok("get_stuck_tasks() faqat progressing tasklarni qaytaradi")
+        else:
+            tracker.fail("get_stuck_tasks", f"Kutilmagan tasklar: {stuck_ids & {test_key3, test_key6}}")
+
+        # 4.16 Indexlar mavjudligi
         conn = sqlite3.connect(DB_FILE)
         cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='task_processing'")
         indexes = {row[0] for row in cursor.fetchall()}
         conn.close()
 
-        expected_indexes = {'idx_task_status', 'idx_service1_status', 'idx_service2_status'}
+        expected_indexes = {'idx_progressing_by_time'}
         if expected_indexes.issubset(indexes):
             tracker.ok(f"DB indexlar mavjud: {expected_indexes}")
         else:
             tracker.fail("DB indexlar", f"Yo'q: {expected_indexes - indexes}")
 
+        dropped_indexes = {'idx_task_status', 'idx_service1_status', 'idx_service2_status'} & indexes
+        if not dropped_indexes:
+            tracker.ok("Eski status indexlar o'chirilgan")
+        else:
+            tracker.fail("DB indexlar (v3)", f"O'chirilmagan: {dropped_indexes}")
+
     except Exception as e:
         tracker.fail("DB test umumiy", str(e))
 
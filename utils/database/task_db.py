@@ -10,21 +10,154 @@ Version: 1.0
 """
 import sqlite3
 import os
+import re
+import time
+import random
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple, NamedTuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 # DB fayl joylashuvi
-DB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
-DB_FILE = os.path.join(DB_DIR, 'processing.db')
+DB_DIR = Path(__file__).resolve().parent.parent / 'data'
+DB_FILE = DB_DIR / 'processing.db'
+
+_db_dir_ready = False
+
+# Lock kutish vaqti (ms) - uzoq bloklanish o'rniga qisqa kutish + retry
+BUSY_TIMEOUT_MS = int(os.getenv('DB_SQLITE_BUSY_TIMEOUT', '5000'))
+_WRITE_RETRIES = 4
+
+# WAL faylini cheklash: har N ta commitdan keyin TRUNCATE checkpoint
+_CHECKPOINT_EVERY = 1000
+_write_count = 0
+
+# Lazy DB init (import paytida emas, birinchi ulanishda)
+_initialized = False
+_init_lock = threading.Lock()
+
+# Label kalit so'zlari -> task turi (tartib = ustuvorlik)
+_TASK_TYPE_KEYWORDS = {
+    'product': ['product', 'mahsulot', 'feature'],
+    'client': ['client', 'mijoz', 'customer'],
+    'bug': ['bug', 'xato', 'defect'],
+    'error': ['error', 'crash', 'exception'],
+    'analiz': ['analiz', 'analysis', 'research']
+}
+_TASK_TYPE_PRIORITY = {task_type: i for i, task_type in enumerate(_TASK_TYPE_KEYWORDS)}
+_KEYWORD_TO_TYPE = {
+    keyword: task_type
+    for task_type, keywords in _TASK_TYPE_KEYWORDS.items()
+    for keyword in keywords
+}
+_TASK_TYPE_KEYWORD_RE = re.compile('|'.join(map(re.escape, _KEYWORD_TO_TYPE)))
+
+# PR fayl yo'llaridan texnologiya aniqlash (har bir texnologiya - bitta alternation)
+_TECH_PATTERNS = {
+    'Oracle': re.compile(r'\.sql$|\.pks$|\.pkb$|\.pck$|/oracle/', re.IGNORECASE),
+    'HTML': re.compile(r'\.html?$', re.IGNORECASE),
+    'Java': re.compile(r'\.java$', re.IGNORECASE),
+    'JavaScript': re.compile(r'\.jsx?$', re.IGNORECASE),
+    'TypeScript': re.compile(r'\.tsx?$', re.IGNORECASE),
+    'Python': re.compile(r'\.py$', re.IGNORECASE),
+}
+
+# Feature extraction patterns
+_FEATURE_PATTERNS = [
+    re.compile(r'main/page/form/[^/]+/([^/]+)/'),    # HTML forms
+    re.compile(r'main/oracle/[^/]+/([^/]+)/'),       # Oracle packages
+    re.compile(r'main/app/([^/]+)/'),                 # Java app
+    re.compile(r'src/([^/]+)/'),                      # Generic src
+]
+
+_FEATURE_CLEAN_RE = re.compile(r'[^a-z0-9_]')
+
+# upsert_task uchun generatsiya qilingan SQL keshi (kalit: saralangan maydonlar)
+_SQL_CACHE: Dict[Tuple[str, ...], str] = {}
 
 
 def _ensure_db_dir():
-    """Data papkasini yaratish"""
-    Path(DB_DIR).mkdir(parents=True, exist_ok=True)
+    """Data papkasini yaratish (faqat birinchi chaqiruvda)"""
+    global _db_dir_ready
+    if _db_dir_ready:
+        return
+    DB_DIR.mkdir(parents=True, exist_ok=True)
+    _db_dir_ready = True
+
+
+def _connect() -> sqlite3.Connection:
+    """DB ga ulanish (statement keshi bilan)"""
+    ensure_initialized()
+    conn = sqlite3.connect(DB_FILE, timeout=BUSY_TIMEOUT_MS / 1000, cached_statements=128)
+    # WAL rejimida NORMAL xavfsiz: faqat oxirgi tranzaksiya yo'qolishi mumkin, buzilish yo'q
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _after_commit(conn: sqlite3.Connection) -> None:
+    """Commitlarni sanash va vaqti-vaqti bilan WAL ni qisqartirish"""
+    global _write_count
+    _write_count += 1
+    if _write_count % _CHECKPOINT_EVERY == 0:
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.warning(f"WAL checkpoint error: {e}")
+
+
+def _execute_write(sql: str, params) -> None:
+    """
+    Bitta yozuvni o'z ulanishida bajarish va commit qilish
+
+    'database is locked' bo'lsa exponential backoff bilan qayta urinadi.
+    """
+    for attempt in range(_WRITE_RETRIES):
+        try:
+            conn = _connect()
+            try:
+                conn.execute(sql, params)
+                conn.commit()
+                _after_commit(conn)
+            finally:
+                conn.close()
+            return
+        except sqlite3.OperationalError as e:
+            if 'locked' not in str(e) or attempt == _WRITE_RETRIES - 1:
+                raise
+            delay = 0.05 * (2 ** attempt) + random.random() * 0.02
+            logger.warning(f"DB locked, retry {attempt + 1}/{_WRITE_RETRIES - 1} in {delay:.2f}s")
+            time.sleep(delay)
+
+
+@contextmanager
+def transaction():
+    """
+    Bir nechta yozuvni bitta tranzaksiyada bajarish
+
+    Webhook oqimidagi ketma-ket yozuvlar (mark_*, set_service*_*) bitta
+    commit bilan saqlanadi. Xato bo'lsa barcha o'zgarishlar bekor qilinadi.
+
+    Misol:
+        with transaction() as conn:
+            increment_return_count(task_key, conn=conn)
+            reset_service_statuses(task_key, conn=conn)
+            mark_progressing(task_key, new_status, conn=conn)
+    """
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn
+        conn.commit()
+        _after_commit(conn)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
 
 def init_db():
@@ -37,6 +170,10 @@ def init_db():
         conn = sqlite3.connect(DB_FILE)
         cursor = conn.cursor()
         
+        # WAL rejimi (DB faylda saqlanadi) - o'quvchilar yozuvchini bloklamaydi
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA wal_autocheckpoint=1000")
+
         # task_processing jadvali
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS task_processing (
@@ -64,22 +201,6 @@ def init_db():
             )
         """)
         
-        # Index yaratish (tez qidirish uchun)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_task_status 
-            ON task_processing(task_status)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_service1_status 
-            ON task_processing(service1_status)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_service2_status 
-            ON task_processing(service2_status)
-        """)
-        
         conn.commit()
         conn.close()
         
@@ -111,29 +232,28 @@ def migrate_db_v2():
 
         logger.info("🔄 DB migration to v2...")
 
-        # Add new columns
-        cursor.execute("ALTER TABLE task_processing ADD COLUMN assignee TEXT NULL")
-        cursor.execute("ALTER TABLE task_processing ADD COLUMN task_type TEXT NULL")
-        cursor.execute("ALTER TABLE task_processing ADD COLUMN feature_name TEXT NULL")
-        cursor.execute("ALTER TABLE task_processing ADD COLUMN technology_stack TEXT NULL")
+        # Barcha DDL bitta tranzaksiyada (bitta commit)
+        conn.executescript("""
+            BEGIN;
 
-        # Indexes for performance
-        cursor.execute("""
+            -- Add new columns
+            ALTER TABLE task_processing ADD COLUMN assignee TEXT NULL;
+            ALTER TABLE task_processing ADD COLUMN task_type TEXT NULL;
+            ALTER TABLE task_processing ADD COLUMN feature_name TEXT NULL;
+            ALTER TABLE task_processing ADD COLUMN technology_stack TEXT NULL;
+
+            -- Indexes for performance
             CREATE INDEX IF NOT EXISTS idx_task_type
-            ON task_processing(task_type)
-        """)
+            ON task_processing(task_type);
 
-        cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_assignee
-            ON task_processing(assignee)
-        """)
+            ON task_processing(assignee);
 
-        cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_feature_name
-            ON task_processing(feature_name)
-        """)
+            ON task_processing(feature_name);
 
-        conn.commit()
+            COMMIT;
+        """)
         conn.close()
         logger.info("✅ DB migration v2 completed!")
 
@@ -142,20 +262,60 @@ def migrate_db_v2():
         raise
 
 
-def get_task(task_id: str) -> Optional[Dict[str, Any]]:
+def migrate_db_v3():
+    """
+    Migrate DB to v3: drop unused service status indexes
+    (idx_service1_status, idx_service2_status) - ular hech bir so'rovda
+    ishlatilmaydi, lekin har bir yozuvda qo'shimcha B-tree yangilanishi beradi.
+    idx_task_status o'rniga get_stuck_tasks uchun partial covering index yaratiladi.
+    Idempotent - safe to run multiple times
+    """
+    try:
+        _ensure_db_dir()
+        conn = sqlite3.connect(DB_FILE)
+
+        conn.executescript("""
+            BEGIN;
+
+            DROP INDEX IF EXISTS idx_service1_status;
+            DROP INDEX IF EXISTS idx_service2_status;
+
+            -- idx_task_status o'rniga: faqat 'progressing' qatorlar,
+            -- get_stuck_tasks index-only scan qiladi (filesort'siz)
+            DROP INDEX IF EXISTS idx_task_status;
+            CREATE INDEX IF NOT EXISTS idx_progressing_by_time
+            ON task_processing(
+                updated_at, task_status, task_id,
+                service1_status, service2_status, last_processed_at
+            )
+            WHERE task_status = 'progressing';
+
+            COMMIT;
+        """)
+        conn.close()
+
+    except Exception as e:
+        logger.error(f"❌ DB migration v3 error: {e}", exc_info=True)
+        raise
+
+
+def get_task(task_id: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
     """
     Task ma'lumotlarini olish
     
     Args:
         task_id: JIRA task key (masalan: DEV-1234)
+        conn: Mavjud ulanish (transaction() ichida), default: yangi ulanish
         
     Returns:
         dict yoki None
     """
     try:
-        conn = sqlite3.connect(DB_FILE)
-        conn.row_factory = sqlite3.Row
+        own_conn = conn is None
+        if own_conn:
+            conn = _connect()
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
         
         cursor.execute("""
             SELECT * FROM task_processing 
@@ -163,7 +323,8 @@ def get_task(task_id: str) -> Optional[Dict[str, Any]]:
         """, (task_id,))
         
         row = cursor.fetchone()
-        conn.close()
+        if own_conn:
+            conn.close()
         
         if row:
             return dict(row)
@@ -174,48 +335,161 @@ def get_task(task_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def upsert_task(task_id: str, fields: Dict[str, Any]):
+def ensure_initialized():
+    """
+    DB jadval va migratsiyalarni bir marta bajarish (idempotent, thread-safe)
+
+    Birinchi ulanishda avtomatik chaqiriladi. Ilova startup'ida oldindan
+    chaqirish ham mumkin.
+    """
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        init_db()
+        migrate_db_v2()  # ✅ Auto-migrate to v2
+        migrate_db_v3()
+        _initialized = True
+
+
+class StuckTask(NamedTuple):
+    """get_stuck_tasks natijasi (kerak bo'lsa ._asdict())"""
+    task_id: str
+    updated_at: str
+    service1_status: str
+    service2_status: str
+    last_processed_at: Optional[str]
+    stuck_minutes: float
+
+
+def get_stuck_tasks(older_than_minutes: int = 30) -> List[StuckTask]:
+    """
+    Uzoq vaqt 'progressing' holatida qolgan tasklarni olish
+
+    WHERE sharti idx_progressing_by_time partial index predikatiga mos,
+    shuning uchun so'rov jadvalga murojaat qilmasdan index orqali bajariladi.
+
+    Args:
+        older_than_minutes: Necha daqiqadan beri yangilanmagan tasklar
+
+    Returns:
+        list: StuckTask ro'yxati (eng eskisi birinchi)
+    """
+    try:
+        cutoff = (datetime.now() - timedelta(minutes=older_than_minutes)).isoformat()
+
+        conn = _connect()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT task_id, updated_at, service1_status, service2_status, last_processed_at,
+                   (julianday('now', 'localtime') - julianday(updated_at)) * 1440
+            FROM task_processing
+            WHERE task_status = 'progressing' AND updated_at < ?
+            ORDER BY updated_at
+        """, (cutoff,))
+
+        tasks = [StuckTask._make(row) for row in cursor]
+        conn.close()
+
+        return tasks
+
+    except Exception as e:
+        logger.error(f"get_stuck_tasks error: {e}", exc_info=True)
+        return []
+
+
+def _get_upsert_sql(columns: Tuple[str, ...]) -> str:
+    """
+    Berilgan maydonlar to'plami uchun UPSERT SQL ni olish (keshdan)
+
+    Bir xil SQL matni sqlite3 statement keshidan qayta foydalanish imkonini beradi.
+    """
+    sql = _SQL_CACHE.get(columns)
+    if sql is None:
+        insert_columns = ", ".join(['task_id', *columns, 'created_at'])
+        placeholders = ", ".join(["?"] * (len(columns) + 2))
+        update_clause = ", ".join([f"{k} = excluded.{k}" for k in columns])
+        sql = (
+            f"INSERT INTO task_processing ({insert_columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(task_id) DO UPDATE SET {update_clause}"
+        )
+        _SQL_CACHE[columns] = sql
+    return sql
+
+
+def _upsert_params(task_id: str, fields: Dict[str, Any], now: str) -> Tuple[Tuple[str, ...], List[Any]]:
+    """UPSERT uchun (saralangan maydonlar, qiymatlar) juftligini tayyorlash"""
+    # updated_at avtomatik yangilanadi
+    fields['updated_at'] = now
+
+    columns = tuple(sorted(fields))
+    values = [task_id, *(fields[k] for k in columns), now]
+    return columns, values
+
+
+def upsert_task(task_id: str, fields: Dict[str, Any], conn: Optional[sqlite3.Connection] = None):
     """
     Task ma'lumotlarini yangilash yoki yaratish
-    
+
+    Bitta INSERT ... ON CONFLICT(task_id) DO UPDATE so'rovi bilan bajariladi
+    (alohida SELECT + UPDATE/INSERT o'rniga).
+
     Args:
         task_id: JIRA task key
         fields: Yangilash kerak bo'lgan maydonlar
+        conn: transaction() ulanishi - berilsa commit qilinmaydi
     """
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
-        # Mavjud taskni tekshirish
-        cursor.execute("SELECT task_id FROM task_processing WHERE task_id = ?", (task_id,))
-        exists = cursor.fetchone()
-        
-        # updated_at avtomatik yangilanadi
-        fields['updated_at'] = datetime.now().isoformat()
-        
-        if exists:
-            # UPDATE
-            set_clause = ", ".join([f"{k} = ?" for k in fields.keys()])
-            values = list(fields.values()) + [task_id]
-            cursor.execute(f"UPDATE task_processing SET {set_clause} WHERE task_id = ?", values)
+        columns, values = _upsert_params(task_id, fields, datetime.now().isoformat())
+
+        if conn is not None:
+            conn.execute(_get_upsert_sql(columns), values)
         else:
-            # INSERT
-            fields['task_id'] = task_id
-            fields['created_at'] = datetime.now().isoformat()
-            columns = ", ".join(fields.keys())
-            placeholders = ", ".join(["?" for _ in fields])
-            values = list(fields.values())
-            cursor.execute(f"INSERT INTO task_processing ({columns}) VALUES ({placeholders})", values)
-        
-        conn.commit()
-        conn.close()
-        
+            _execute_write(_get_upsert_sql(columns), values)
+
     except Exception as e:
         logger.error(f"[{task_id}] upsert_task error: {e}", exc_info=True)
         raise
 
 
-def mark_progressing(task_id: str, jira_status: str, update_time: Optional[datetime] = None):
+def batch_update(updates: List[Tuple[str, Dict[str, Any]]]):
+    """
+    Bir nechta task yozuvini bitta tranzaksiyada saqlash
+
+    Ketma-ket kelgan bir xil maydonli yozuvlar executemany bilan yuboriladi,
+    yozuvlar tartibi saqlanadi.
+
+    Args:
+        updates: [(task_id, fields), ...] ro'yxati
+    """
+    if not updates:
+        return
+
+    now = datetime.now().isoformat()
+
+    with transaction() as conn:
+        batch_columns = None
+        batch_values = []
+        for task_id, fields in updates:
+            columns, values = _upsert_params(task_id, fields, now)
+            if columns != batch_columns and batch_values:
+                conn.executemany(_get_upsert_sql(batch_columns), batch_values)
+                batch_values = []
+            batch_columns = columns
+            batch_values.append(values)
+
+        conn.executemany(_get_upsert_sql(batch_columns), batch_values)
+
+
+def mark_progressing(
+    task_id: str,
+    jira_status: str,
+    update_time: Optional[datetime] = None,
+    conn: Optional[sqlite3.Connection] = None
+):
     """
     Task holatini 'progressing' ga o'zgartirish
     
@@ -223,6 +497,7 @@ def mark_progressing(task_id: str, jira_status: str, update_time: Optional[datet
         task_id: JIRA task key
         jira_status: JIRA status nomi
         update_time: Vaqt (default: hozirgi vaqt)
+        conn: transaction() ulanishi (ixtiyoriy)
     """
     if update_time is None:
         update_time = datetime.now()
@@ -232,30 +507,30 @@ def mark_progressing(task_id: str, jira_status: str, update_time: Optional[datet
         'last_jira_status': jira_status,
         'task_update_time': update_time.isoformat(),
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def mark_completed(task_id: str):
+def mark_completed(task_id: str, conn: Optional[sqlite3.Connection] = None):
     """
     Task holatini 'completed' ga o'zgartirish
     """
     upsert_task(task_id, {
         'task_status': 'completed',
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def mark_returned(task_id: str):
+def mark_returned(task_id: str, conn: Optional[sqlite3.Connection] = None):
     """
     Task holatini 'returned' ga o'zgartirish
     """
     upsert_task(task_id, {
         'task_status': 'returned',
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def mark_error(task_id: str, error_message: str):
+def mark_error(task_id: str, error_message: str, conn: Optional[sqlite3.Connection] = None):
     """
     Task holatini 'error' ga o'zgartirish
     
@@ -267,22 +542,35 @@ def mark_error(task_id: str, error_message: str):
         'task_status': 'error',
         'error_message': error_message,
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def increment_return_count(task_id: str):
+def increment_return_count(task_id: str, conn: Optional[sqlite3.Connection] = None):
     """
     Return count ni 1 ga oshirish
+
+    Atomik UPSERT: o'qish-o'zgartirish-yozish poygasi (race) bo'lmaydi.
+    """
+    now = datetime.now().isoformat()
+    sql = """
+        INSERT INTO task_processing (task_id, return_count, created_at, updated_at)
+        VALUES (?, 1, ?, ?)
+        ON CONFLICT(task_id) DO UPDATE SET
+            return_count = COALESCE(return_count, 0) + 1,
+            updated_at = excluded.updated_at
     """
-    task = get_task(task_id)
-    if task:
-        new_count = (task.get('return_count') or 0) + 1
-        upsert_task(task_id, {'return_count': new_count})
-    else:
-        upsert_task(task_id, {'return_count': 1})
+    try:
+        if conn is not None:
+            conn.execute(sql, (task_id, now, now))
+        else:
+            _execute_write(sql, (task_id, now, now))
+
+    except Exception as e:
+        logger.error(f"[{task_id}] increment_return_count error: {e}", exc_info=True)
+        raise
 
 
-def set_skip_detected(task_id: str):
+def set_skip_detected(task_id: str, conn: Optional[sqlite3.Connection] = None):
     """
     Skip detected flag ni True ga o'rnatish
     """
@@ -290,10 +578,14 @@ def set_skip_detected(task_id: str):
         'skip_detected': 1,
         'task_status': 'completed',  # yoki 'skipped'
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def set_service1_done(task_id: str, compliance_score: Optional[int] = None):
+def set_service1_done(
+    task_id: str,
+    compliance_score: Optional[int] = None,
+    conn: Optional[sqlite3.Connection] = None
+):
     """
     Service1 (TZ-PR) holatini 'done' ga o'zgartirish
     
@@ -309,10 +601,10 @@ def set_service1_done(task_id: str, compliance_score: Optional[int] = None):
     if compliance_score is not None:
         fields['compliance_score'] = compliance_score
     
-    upsert_task(task_id, fields)
+    upsert_task(task_id, fields, conn=conn)
 
 
-def set_service1_error(task_id: str, error_msg: str):
+def set_service1_error(task_id: str, error_msg: str, conn: Optional[sqlite3.Connection] = None):
     """
     Service1 (TZ-PR) holatini 'error' ga o'zgartirish
     
@@ -325,10 +617,10 @@ def set_service1_error(task_id: str, error_msg: str):
         'service1_error': error_msg,
         'task_status': 'error',
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def set_service2_done(task_id: str):
+def set_service2_done(task_id: str, conn: Optional[sqlite3.Connection] = None):
     """
     Service2 (Testcase) holatini 'done' ga o'zgartirish
     """
@@ -338,10 +630,10 @@ def set_service2_done(task_id: str):
         'service2_error': None,
         'task_status': 'completed',
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def set_service2_error(task_id: str, error_msg: str):
+def set_service2_error(task_id: str, error_msg: str, conn: Optional[sqlite3.Connection] = None):
     """
     Service2 (Testcase) holatini 'error' ga o'zgartirish
     
@@ -354,10 +646,10 @@ def set_service2_error(task_id: str, error_msg: str):
         'service2_error': error_msg,
         'task_status': 'error',
         'last_processed_at': datetime.now().isoformat()
-    })
+    }, conn=conn)
 
 
-def reset_service_statuses(task_id: str):
+def reset_service_statuses(task_id: str, conn: Optional[sqlite3.Connection] = None):
     """
     Service holatlarini qayta ishlash uchun reset qilish
 
@@ -372,7 +664,7 @@ def reset_service_statuses(task_id: str):
         'service1_done_at': None,
         'service2_done_at': None,
         'compliance_score': None
-    })
+    }, conn=conn)
 
 
 def _extract_task_type(task_details: Dict) -> str:
@@ -381,22 +673,21 @@ def _extract_task_type(task_details: Dict) -> str:
 
     Returns one of: product, client, bug, error, analiz, other
     """
-    # Priority 1: Check labels
+    # Priority 1: Check labels (kalit so'zlar label ichida substring sifatida)
     labels = task_details.get('labels', [])
-    labels_lower = [label.lower() for label in labels]
-
-    type_keywords = {
-        'product': ['product', 'mahsulot', 'feature'],
-        'client': ['client', 'mijoz', 'customer'],
-        'bug': ['bug', 'xato', 'defect'],
-        'error': ['error', 'crash', 'exception'],
-        'analiz': ['analiz', 'analysis', 'research']
-    }
-
-    for task_type, keywords in type_keywords.items():
-        for keyword in keywords:
-            if any(keyword in label for label in labels_lower):
-                return task_type
+    if labels:
+        best_type = None
+        best_priority = len(_TASK_TYPE_PRIORITY)
+        labels_text = '\n'.join(label.lower() for label in labels)
+        for match in _TASK_TYPE_KEYWORD_RE.finditer(labels_text):
+            task_type = _KEYWORD_TO_TYPE[match.group()]
+            priority = _TASK_TYPE_PRIORITY[task_type]
+            if priority < best_priority:
+                best_type, best_priority = task_type, priority
+                if priority == 0:
+                    break
+        if best_type:
+            return best_type
 
     # Priority 2: Issue type name
     issue_type = task_details.get('type', '').lower()
@@ -422,46 +713,23 @@ def _extract_features_from_pr_files(pr_files: List[Dict]) -> tuple:
     Returns:
         tuple: (feature_names_csv, tech_stack_csv) or (None, None)
     """
-    import re
-
     features = set()
     technologies = set()
 
-    # Technology patterns
-    tech_patterns = {
-        'Oracle': [r'\.sql$', r'\.pks$', r'\.pkb$', r'\.pck$', r'/oracle/'],
-        'HTML': [r'\.html?$'],
-        'Java': [r'\.java$'],
-        'JavaScript': [r'\.jsx?$'],
-        'TypeScript': [r'\.tsx?$'],
-        'Python': [r'\.py$'],
-    }
-
-    # Feature extraction patterns
-    feature_patterns = [
-        r'main/page/form/[^/]+/([^/]+)/',    # HTML forms
-        r'main/oracle/[^/]+/([^/]+)/',       # Oracle packages
-        r'main/app/([^/]+)/',                 # Java app
-        r'src/([^/]+)/',                      # Generic src
-    ]
-
     for file_data in pr_files:
         filename = file_data.get('filename', '')
 
         # Detect technology
-        for tech, patterns in tech_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, filename, re.IGNORECASE):
-                    technologies.add(tech)
-                    break
+        for tech, pattern in _TECH_PATTERNS.items():
+            if pattern.search(filename):
+                technologies.add(tech)
 
         # Extract feature
-        for pattern in feature_patterns:
-            match = re.search(pattern, filename)
+        for pattern in _FEATURE_PATTERNS:
+            match = pattern.search(filename)
             if match:
-                feature = match.group(1)
                 # Clean: lowercase, remove non-alphanumeric
-                feature = re.sub(r'[^a-z0-9_]', '', feature.lower())
+                feature = _FEATURE_CLEAN_RE.sub('', match.group(1).lower())
                 if len(feature) > 2:  # Skip too short
                     features.add(feature)
 
@@ -512,10 +780,3 @@ def update_task_metadata(
     except Exception as e:
         logger.error(f"[{task_id}] Metadata update error: {e}")
 
-
-# DB initialization on import
-try:
-    init_db()
-    migrate_db_v2()  # ✅ Auto-migrate to v2
-except Exception as e:
-    logger.warning(f"DB initialization warning: {e}")
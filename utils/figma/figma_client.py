@@ -4,13 +4,32 @@ Figma API Client - Production Version
 Figma REST API bilan ishlash va file ma'lumotlarini olish
 """
 import requests
+from requests.adapters import HTTPAdapter
 import os
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
 from dataclasses import dataclass
 
+try:
+    import ijson  # Katta file JSON'ni oqim (stream) bilan o'qish
+except ImportError:
+    ijson = None
 
-@dataclass
+
+# Figma URL parsing
+_FILE_KEY_RE = re.compile(r'/(?:file|design|proto)/([A-Za-z0-9]+)')
+_NODE_ID_RE = re.compile(r'node-id=([^&\s]+)')
+
+# Frame'lar uchun yetarli chuqurlik: page -> frame -> frame children (children_count)
+_FRAMES_DEPTH = 3
+
+# file_key -> (vaqt, summary) - bir task uchun qayta webhook'larda API chaqirilmaydi
+SUMMARY_CACHE_TTL = 300
+_SUMMARY_CACHE: Dict[str, Tuple[float, str]] = {}
+
+
+@dataclass(slots=True)
 class FigmaFrame:
     """Figma frame ma'lumotlari"""
     id: str
@@ -35,14 +54,56 @@ class FigmaClient:
 
         self.headers = {'X-Figma-Token': self.access_token}
 
-    def get_file_metadata(self, file_key: str) -> Optional[Dict]:
-        """Get file metadata"""
+        # HTTPS ulanishlarni qayta ishlatish (har so'rovda yangi TLS handshake yo'q)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        """HTTP session'ni yopish"""
+        self.session.close()
+
+    def _fetch_file(self, file_key: str, timeout: int = 20, depth: Optional[int] = None) -> Optional[Dict]:
+        """
+        GET /files/{file_key} - JSON yoki None
+
+        depth: document daraxti chuqurligi (1 - faqat page'lar, 2 - page + top-level
+        node'lar, 3 - top-level node'larning bevosita children'i ham).
+        None - butun daraxt.
+        """
+        url = f"{self.base_url}/files/{file_key}"
+        params = {'depth': depth} if depth else None
+        response = self.session.get(url, params=params, timeout=timeout)
+
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    def _stream_pages(self, file_key: str) -> Iterator[Dict]:
+        """
+        document.children (page'lar) ni birma-bir o'qish (ijson)
+
+        Butun JSON dict'ga aylantirilmaydi - iteratsiya to'xtatilsa
+        qolgan javob o'qilmaydi.
+        """
+        url = f"{self.base_url}/files/{file_key}"
+        response = self.session.get(url, params={'depth': _FRAMES_DEPTH}, stream=True, timeout=20)
         try:
-            url = f"{self.base_url}/files/{file_key}"
-            response = requests.get(url, headers=self.headers, timeout=15)
+            if response.status_code != 200:
+                return
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'document.children.item', use_float=True)
+        finally:
+            response.close()
+
+    def get_file_metadata(self, file_key: str, data: Optional[Dict] = None) -> Optional[Dict]:
+        """Get file metadata (data - oldindan olingan file JSON, ixtiyoriy)"""
+        try:
+            if data is None:
+                data = self._fetch_file(file_key, timeout=15, depth=1)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 document = data.get('document', {})
                 pages = len(document.get('children', []))
 
@@ -58,21 +119,26 @@ class FigmaClient:
         except Exception:
             return None
 
-    def get_file_frames(self, file_key: str, max_frames: int = 20) -> List[FigmaFrame]:
-        """Get frames from file"""
+    def get_file_frames(
+        self,
+        file_key: str,
+        max_frames: int = 20,
+        data: Optional[Dict] = None
+    ) -> List[FigmaFrame]:
+        """Get frames from file (data - oldindan olingan file JSON, ixtiyoriy)"""
         try:
-            url = f"{self.base_url}/files/{file_key}"
-            response = requests.get(url, headers=self.headers, timeout=20)
-
-            if response.status_code != 200:
-                return []
+            if data is not None:
+                pages = data.get('document', {}).get('children', [])
+            elif ijson is not None:
+                pages = self._stream_pages(file_key)
+            else:
+                data = self._fetch_file(file_key, depth=_FRAMES_DEPTH)
+                if data is None:
+                    return []
+                pages = data.get('document', {}).get('children', [])
 
-            data = response.json()
             frames = []
 
-            document = data.get('document', {})
-            pages = document.get('children', [])
-
             for page in pages:
                 page_name = page.get('name', 'Page')
 
@@ -102,13 +168,22 @@ class FigmaClient:
             return []
 
     def get_file_summary(self, file_key: str) -> str:
-        """Get AI-friendly summary"""
+        """Get AI-friendly summary (SUMMARY_CACHE_TTL sekund keshlanadi)"""
+        cached = _SUMMARY_CACHE.get(file_key)
+        if cached and time.monotonic() - cached[0] < SUMMARY_CACHE_TTL:
+            return cached[1]
+
         try:
-            metadata = self.get_file_metadata(file_key)
+            # Bitta so'rov - metadata va frame'lar bir xil JSON'dan
+            try:
+                data = self._fetch_file(file_key, depth=_FRAMES_DEPTH)
+            except Exception:
+                data = None
+            metadata = self.get_file_metadata(file_key, data=data) if data else None
             if not metadata:
                 return "Figma file'ga access yo'q"
 
-            frames = self.get_file_frames(file_key, max_frames=15)
+            frames = self.get_file_frames(file_key, max_frames=15, data=data)
 
             lines = [
                 f"📐 FIGMA: {metadata['name']}",
@@ -130,14 +205,16 @@ class FigmaClient:
             else:
                 lines.append("⚠️  Frame'lar topilmadi")
 
-            return "\n".join(lines)
+            summary = "\n".join(lines)
+            _SUMMARY_CACHE[file_key] = (time.monotonic(), summary)
+            return summary
         except Exception as e:
             return f"Figma summary error: {str(e)}"
 
     @staticmethod
     def parse_figma_url(url: str) -> Optional[Dict]:
         """Parse Figma URL"""
-        file_key_match = re.search(r'/(?:file|design|proto)/([A-Za-z0-9]+)', url)
+        file_key_match = _FILE_KEY_RE.search(url)
 
         if not file_key_match:
             return None
@@ -145,7 +222,7 @@ class FigmaClient:
         file_key = file_key_match.group(1)
 
         node_id = None
-        node_match = re.search(r'node-id=([^&\s]+)', url)
+        node_match = _NODE_ID_RE.search(url) if 'node-id=' in url else None
         if node_match:
             node_id = node_match.group(1).replace('-', ':')
 
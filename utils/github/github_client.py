@@ -7,10 +7,146 @@ GitHub API Client - PR va kod olish
 YANGI: Branch name bilan ham PR qidirish!
 """
 import requests
-import base64
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import binascii
 import re
-from typing import List, Dict, Optional, Tuple
+import orjson
+import threading
+from functools import lru_cache, partial
+from operator import itemgetter
+from cachetools import TTLCache, LRUCache
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+from typing import List, Dict, Optional, Tuple, Union
 import time
+import os
+import asyncio
+import logging
+from pathlib import Path
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 (httpx[http2]) ixtiyoriy: h2 o'rnatilmagan bo'lsa requests session ishlatiladi
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_PR_URL_RE = re.compile(r'github\.com/([^/]+)/([^/]+)/pulls?/(\d+)')
+_JIRA_KEY_RE = re.compile(r'^([A-Z]+-?)(\d+)$')
+
+# Adaptive throttle: qolgan limit shu ulushdan kam bo'lsa so'rovlar tekis taqsimlanadi
+_THROTTLE_BELOW = 0.5
+
+# Blob keshi: SHA o'zgarmas, shuning uchun decode qilingan matn diskda abadiy saqlanadi
+BLOB_CACHE_DIR = Path(__file__).resolve().parent.parent / 'data' / 'github_blobs'
+_SHA_RE = re.compile(r'[0-9a-f]{40,64}')
+# Disk keshi hajmi chegarasi: oshsa eng eski (mtime) fayllar o'chiriladi, 80% gacha
+BLOB_CACHE_MAX_BYTES = int(os.getenv('GITHUB_BLOB_CACHE_MAX_MB', '256')) * 1024 * 1024
+# Papkani skanerlash qimmat — har N ta yozuvda bir marta tekshiriladi (birinchisi ham)
+_BLOB_PRUNE_EVERY = 100
+_blob_write_count = 0
+_blob_prune_lock = threading.Lock()
+
+# Secondary rate limit (403/429 + Retry-After) uchun qayta urinishlar
+_RATE_LIMIT_RETRIES = 3
+# Client bo'yicha bir vaqtdagi so'rovlar chegarasi (secondary rate limit: concurrent requests)
+_MAX_CONCURRENT_REQUESTS = 5
+# Retry-After'siz secondary limit javobi: GitHub kamida 1 daqiqa kutishni tavsiya qiladi
+_SECONDARY_LIMIT_WAIT = 60
+# Bitta so'rov uchun rate limit kutishlarining umumiy chegarasi (sekund): oshsa javob
+# qaytariladi va qaror chaqiruvchiga qoladi (webhook worker daqiqalab bloklanmasin)
+_MAX_RATE_LIMIT_WAIT = 60
+# HTTP/2 client uchun server xatolarida qayta urinish (requests'da Retry adapter bajaradi)
+_RETRY_STATUSES = (502, 503, 504)
+
+# PR files javobida har doim mavjud maydonlar (C darajasidagi itemgetter bilan olinadi);
+# patch (binary fayllarda) va previous_filename (faqat rename'da) ixtiyoriy
+_PR_FILE_KEYS = (
+    'filename', 'status', 'additions', 'deletions', 'changes',
+    'blob_url', 'raw_url', 'contents_url', 'sha'
+)
+_get_pr_file_fields = itemgetter(*_PR_FILE_KEYS)
+
+# GitHub search: bitta so'rovda ko'pi bilan 5 ta AND/OR/NOT operator → 6 ta head: termi
+_MAX_OR_TERMS = 6
+
+# GraphQL search node: faqat kerakli PR maydonlari (Issue natijalari {} bo'lib keladi)
+_GRAPHQL_PR_NODES = 'nodes { ... on PullRequest { url title state headRefName body } }'
+
+
+def _numeric_boundary_re(numeric_part: str) -> re.Pattern:
+    """numeric_part ni raqamlar orasida emas, alohida topadigan pattern ((?<!\\d)7068(?!\\d))"""
+    return re.compile(r'(?<!\d)' + re.escape(numeric_part) + r'(?!\d)')
+
+
+def _run_sync(coro):
+    """
+    Coroutine'ni sinxron koddan bajarish.
+
+    Event loop allaqachon ishlayotgan bo'lsa (FastAPI background task ichida),
+    asyncio.run alohida thread'da chaqiriladi.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _prune_blob_cache():
+    """Blob disk keshi BLOB_CACHE_MAX_BYTES dan oshsa eng eski fayllarni o'chirish"""
+    try:
+        entries = []
+        total = 0
+        for entry in os.scandir(BLOB_CACHE_DIR):
+            if entry.is_file() and _SHA_RE.fullmatch(entry.name):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    except OSError as e:
+        print(f"⚠️ Blob kesh skanerlash xatosi: {e}")
+        return
+
+    if total <= BLOB_CACHE_MAX_BYTES:
+        return
+
+    target = BLOB_CACHE_MAX_BYTES * 0.8
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= target:
+            break
+
+
+def _decode_base64(content: str) -> str:
+    """
+    GitHub base64 content'ni matnga aylantirish.
+
+    binascii.a2b_base64 — base64.b64decode ostidagi C funksiya; strict bo'lmagan
+    rejimda '\n' kabi alfavitdan tashqari belgilarni o'zi o'tkazib yuboradi.
+    """
+    return binascii.a2b_base64(content.encode('ascii')).decode('utf-8', errors='ignore')
+
+
+@lru_cache(maxsize=512)
+def _parse_pr_url(pr_url: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    """parse_pr_url uchun keshlangan sof funksiya"""
+    match = _PR_URL_RE.search(pr_url)
+    if match:
+        return match.group(1), match.group(2), int(match.group(3))
+
+    return None, None, None
 
 
 class GitHubClient:
@@ -21,11 +157,11 @@ class GitHubClient:
         Args:
             token: GitHub Personal Access Token
         """
-        from config.settings import settings
-
         self.token = token or settings.GITHUB_TOKEN
         self.base_url = settings.GITHUB_API_URL
         self.org = settings.GITHUB_ORG
+        # Timeout bir marta aniqlanadi (har so'rovda settings o'qilmaydi)
+        self.timeout = self._resolve_timeout()
 
         self.headers = {
             'Accept': 'application/vnd.github.v3+json',
@@ -36,34 +172,216 @@ class GitHubClient:
             self.headers['Authorization'] = f'token {self.token}'
 
         # Rate limit tracking
+        self.rate_limit_limit = 5000
         self.rate_limit_remaining = 5000
         self.rate_limit_reset = 0
 
-        # Session for backward compatibility with tz_pr_service
+        # Adaptive throttle: so'rovlar orasidagi minimal interval (sekund)
+        self._min_interval = 0.0
+        self._last_request_ts = 0.0
+        self._rate_lock = threading.Lock()
+        # Thread/task sonidan qat'i nazar parallel so'rovlar ko'pi bilan 5 ta
+        self._concurrency_sem = threading.BoundedSemaphore(_MAX_CONCURRENT_REQUESTS)
+
+        # get_pr_info keshi: (owner, repo, pr_number) -> info (5 daqiqa)
+        self._pr_info_cache = TTLCache(maxsize=256, ttl=300)
+        self._pr_info_lock = threading.Lock()
+        # TTL tugagandan keyin revalidatsiya: key -> (Last-Modified, info), 304 rate limit sarflamaydi
+        self._pr_last_modified = LRUCache(maxsize=512)
+
+        # Fayl content keshi: (owner, repo, path, ref) -> (etag, content), If-None-Match uchun
+        self._content_cache = LRUCache(maxsize=512)
+        # Blob keshi (xotira qatlami): sha -> decode qilingan content
+        self._blob_cache = LRUCache(maxsize=256)
+        self._content_lock = threading.Lock()
+
+        # Pooled session: barcha so'rovlar bitta TLS ulanishlar pulidan foydalanadi
+        # (HTTP/2 bo'lmasa SmartPatchHelper ham shu session'dan get() orqali foydalanadi)
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        # api.github.com + raw_url (github.com / raw.githubusercontent.com) redirect'lari
+        self.session.mount('https://', adapter)
+
+        # HTTP/2 client: parallel sahifa/search/file so'rovlari bitta ulanishda multiplex qilinadi.
+        # GraphQL POST requests session orqali qoladi.
+        self._http2_client = None
+        if HTTP2_AVAILABLE:
+            self._http2_client = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                # transport berilganda Client(limits=...) e'tiborga olinmaydi — limits transport'da
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+                ),
+                follow_redirects=True,
+                timeout=self.timeout
+            )
+
+    @staticmethod
+    def _resolve_timeout() -> float:
+        """GITHUB_TIMEOUT sozlamasi (noto'g'ri bo'lsa 30 sekund)"""
+        try:
+            return float(settings.GITHUB_TIMEOUT)
+        except (AttributeError, TypeError, ValueError):
+            return 30.0
+
+    def refresh_settings(self):
+        """Runtime'da o'zgargan sozlamalarni qayta o'qish (base_url, org, timeout)"""
+        self.base_url = settings.GITHUB_API_URL
+        self.org = settings.GITHUB_ORG
+        self.timeout = self._resolve_timeout()
+        if self._http2_client is not None:
+            self._http2_client.timeout = httpx.Timeout(self.timeout)
+
+    def close(self):
+        """HTTP session'ni yopish"""
+        self.session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
+
+    def get(
+            self,
+            url: str,
+            headers: Dict = None,
+            params: Dict = None
+    ) -> Union[requests.Response, httpx.Response]:
+        """
+        Bitta GET so'rov (retry'siz) — client-wide cheklovlar bilan
+
+        Adaptive throttle, bir vaqtdagi so'rovlar semaforasi (_MAX_CONCURRENT_REQUESTS) va
+        X-RateLimit-* hisobi qo'llanadi. Tashqi fetcher'lar (SmartPatchHelper) shu orqali
+        so'rov yuboradi, shunda cheklov barcha thread'lar uchun umumiy bo'ladi.
+        """
+        self._throttle()
+        with self._concurrency_sem:
+            if self._http2_client is not None:
+                response = self._http2_client.get(url, headers=headers, params=params)
+            else:
+                response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+        self._update_rate_limit(response)
+        return response
 
-    def _make_request(self, url: str, accept_header: str = None, params: Dict = None) -> requests.Response:
-        """API so'rov yuborish (rate limit bilan)"""
-        headers = self.headers.copy()
+    def _make_request(
+            self,
+            url: str,
+            accept_header: str = None,
+            params: Dict = None,
+            extra_headers: Dict = None
+    ) -> Union[requests.Response, httpx.Response]:
+        """API so'rov yuborish (HTTP/2 mavjud bo'lsa httpx, adaptive rate limit + retry bilan)"""
+        headers = dict(extra_headers) if extra_headers else {}
         if accept_header:
             headers['Accept'] = accept_header
+        headers = headers or None
 
-        # Rate limit tekshirish
-        if self.rate_limit_remaining < 10:
-            wait_time = self.rate_limit_reset - time.time()
-            if wait_time > 0:
-                print(f"⏳ Rate limit kutish: {wait_time:.0f} sekund")
-                time.sleep(wait_time + 1)
+        waited = 0.0
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            response = self.get(url, headers=headers, params=params)
+
+            if attempt == _RATE_LIMIT_RETRIES:
+                return response
+
+            # Secondary rate limit: 403/429 + Retry-After
+            retry_after = response.headers.get('Retry-After')
+            if response.status_code in (403, 429) and retry_after is not None:
+                try:
+                    wait_time = max(float(retry_after), 2 ** attempt)
+                except ValueError:
+                    wait_time = 60.0
+            elif response.status_code in (403, 429) and 'secondary rate limit' in response.text.lower():
+                wait_time = _SECONDARY_LIMIT_WAIT * 2 ** attempt
+            elif response.status_code in _RETRY_STATUSES and self._http2_client is not None:
+                wait_time = 0.5 * 2 ** attempt
+            else:
+                return response
 
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+            if waited + wait_time > _MAX_RATE_LIMIT_WAIT:
+                print(f"⚠️ Rate limit kutish chegarasi ({_MAX_RATE_LIMIT_WAIT}s) oshadi — "
+                      f"{response.status_code} javobi qaytarildi")
+                return response
 
-        # Rate limit yangilash
-        self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
-        self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
+            if response.status_code in (403, 429):
+                print(f"⏳ Secondary rate limit: {wait_time:.0f} sekund kutish ({attempt + 1}/{_RATE_LIMIT_RETRIES})")
+            waited += wait_time
+            time.sleep(wait_time)
 
         return response
 
+    def _throttle(self):
+        """Oldingi so'rovdan beri _min_interval o'tmagan bo'lsa kutish (slot lock ostida band qilinadi)"""
+        with self._rate_lock:
+            now = time.time()
+            wait_time = self._min_interval - (now - self._last_request_ts)
+            self._last_request_ts = now + max(0.0, wait_time)
+
+        if wait_time > 0:
+            if wait_time > 1:
+                print(f"⏳ Rate limit kutish: {wait_time:.0f} sekund")
+            time.sleep(wait_time)
+
+    def _update_rate_limit(self, response: Union[requests.Response, httpx.Response]):
+        """
+        X-RateLimit-* header'lardan limitni yangilash va so'rovlar oralig'ini hisoblash.
+
+        Qolgan limit kam bo'lsa: interval = (reset - now) / remaining, ya'ni
+        iste'mol GitHub qayta to'ldirish tezligidan oshmaydi.
+        """
+        headers = response.headers
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        # search/graphql limitlari alohida — core hisobini buzmasin
+        if headers.get('X-RateLimit-Resource', 'core') != 'core':
+            return
+
+        with self._rate_lock:
+            self.rate_limit_limit = int(headers.get('X-RateLimit-Limit', self.rate_limit_limit))
+            self.rate_limit_remaining = int(headers['X-RateLimit-Remaining'])
+            self.rate_limit_reset = int(headers.get('X-RateLimit-Reset', 0))
+
+            if self.rate_limit_remaining < self.rate_limit_limit * _THROTTLE_BELOW:
+                window = self.rate_limit_reset - time.time()
+                self._min_interval = max(0.0, window / max(1, self.rate_limit_remaining))
+            else:
+                self._min_interval = 0.0
+
+    def _graphql(self, query: str, variables: Dict = None) -> Optional[Dict]:
+        """
+        GitHub GraphQL API ga so'rov yuborish.
+
+        Returns:
+            'data' dict yoki None (token yo'q / xatolik — REST fallback uchun)
+        """
+        if not self.token:
+            return None
+
+        try:
+            with self._concurrency_sem:
+                response = self.session.post(
+                    f"{self.base_url}/graphql",
+                    json={'query': query, 'variables': variables or {}},
+                    timeout=self.timeout
+                )
+        except requests.RequestException as e:
+            print(f"   ⚠️ GraphQL exception: {e}")
+            return None
+
+        if response.status_code != 200:
+            print(f"   ⚠️ GraphQL error: {response.status_code}")
+            return None
+
+        payload = response.json()
+        data = payload.get('data')
+        if payload.get('errors'):
+            print(f"   ⚠️ GraphQL errors: {payload['errors'][0].get('message')}")
+        return data
+
     def parse_pr_url(self, pr_url: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
         """
         PR URL dan owner, repo, pr_number ajratish
@@ -76,22 +394,31 @@ class GitHubClient:
         Returns:
             (owner, repo, pr_number) yoki (None, None, None)
         """
-        patterns = [
-            r'github\.com/([^/]+)/([^/]+)/pull/(\d+)',
-            r'github\.com/([^/]+)/([^/]+)/pulls/(\d+)',
-        ]
+        return _parse_pr_url(pr_url)
 
-        for pattern in patterns:
-            match = re.search(pattern, pr_url)
-            if match:
-                return match.group(1), match.group(2), int(match.group(3))
+    def get_pr_info(self, owner: str, repo: str, pr_number: int) -> Optional[Dict]:
+        """
+        PR asosiy ma'lumotlarini olish (TTL kesh bilan)
 
-        return None, None, None
+        TTL tugagach If-Modified-Since yuboriladi: PR o'zgarmagan bo'lsa 304
+        qaytadi va oldingi natija JSON parse qilinmasdan qayta ishlatiladi.
+        """
+        cache_key = (owner, repo, pr_number)
+        with self._pr_info_lock:
+            cached = self._pr_info_cache.get(cache_key)
+            stale = self._pr_last_modified.get(cache_key)
+        if cached is not None:
+            return cached
 
-    def get_pr_info(self, owner: str, repo: str, pr_number: int) -> Optional[Dict]:
-        """PR asosiy ma'lumotlarini olish"""
         url = f'{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}'
-        response = self._make_request(url)
+        response = self._make_request(
+            url, extra_headers={'If-Modified-Since': stale[0]} if stale else None
+        )
+
+        if response.status_code == 304 and stale:
+            with self._pr_info_lock:
+                self._pr_info_cache[cache_key] = stale[1]
+            return stale[1]
 
         if response.status_code != 200:
             print(f"❌ PR info olishda xatolik: {response.status_code}")
@@ -99,7 +426,7 @@ class GitHubClient:
 
         data = response.json()
 
-        return {
+        pr_info = {
             'title': data.get('title', ''),
             'state': data.get('state', ''),
             'merged': data.get('merged', False),
@@ -116,6 +443,13 @@ class GitHubClient:
             'body': data.get('body', '')
         }
 
+        last_modified = response.headers.get('Last-Modified')
+        with self._pr_info_lock:
+            self._pr_info_cache[cache_key] = pr_info
+            if last_modified:
+                self._pr_last_modified[cache_key] = (last_modified, pr_info)
+        return pr_info
+
     def get_pr_files(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
         """
         PR da o'zgargan fayllar ro'yxatini olish
@@ -125,46 +459,67 @@ class GitHubClient:
         url = f'{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/files'
 
         all_files = []
-        page = 1
-        per_page = 100
 
-        while True:
-            paginated_url = f'{url}?page={page}&per_page={per_page}'
-            response = self._make_request(paginated_url)
+        for files in self._get_all_pages(url, per_page=100, error_label="PR files"):
+            for f in files:
+                pr_file = dict(zip(_PR_FILE_KEYS, _get_pr_file_fields(f)))
+                pr_file['patch'] = f.get('patch', '')
+                pr_file['previous_filename'] = f.get('previous_filename', '')
+                all_files.append(pr_file)
 
-            if response.status_code != 200:
-                print(f"❌ PR files olishda xatolik: {response.status_code}")
-                break
+        return all_files
 
-            files = response.json()
-            if not files:
-                break
+    def _get_all_pages(self, url: str, per_page: int = 100, error_label: str = "Pages") -> List[List[Dict]]:
+        """
+        Paginated endpoint'ning barcha sahifalarini olish
 
-            for f in files:
-                all_files.append({
-                    'filename': f.get('filename', ''),
-                    'status': f.get('status', ''),
-                    'additions': f.get('additions', 0),
-                    'deletions': f.get('deletions', 0),
-                    'changes': f.get('changes', 0),
-                    'patch': f.get('patch', ''),
-                    'blob_url': f.get('blob_url', ''),
-                    'raw_url': f.get('raw_url', ''),
-                    'contents_url': f.get('contents_url', ''),  # 🔥 QO'SHILDI! Smart Patch uchun
-                    'sha': f.get('sha', ''),
-                    'previous_filename': f.get('previous_filename', '')
-                })
+        1-sahifa olinadi, Link header'dagi rel="last" dan oxirgi sahifa raqami
+        aniqlanadi, qolgan sahifalar parallel so'raladi. Natija sahifa tartibida.
+        """
+        response = self._make_request(f'{url}?page=1&per_page={per_page}')
 
-            if len(files) < per_page:
-                break
-            page += 1
+        if response.status_code != 200:
+            print(f"❌ {error_label} olishda xatolik: {response.status_code}")
+            return []
 
-        return all_files
+        pages = [orjson.loads(response.content)]
+
+        last_url = response.links.get('last', {}).get('url', '')
+        last_page = int(parse_qs(urlparse(last_url).query).get('page', ['1'])[0]) if last_url else 1
+
+        if last_page > 1:
+            def fetch(page: int) -> Union[requests.Response, httpx.Response]:
+                return self._make_request(f'{url}?page={page}&per_page={per_page}')
+
+            with ThreadPoolExecutor(max_workers=min(8, last_page - 1)) as executor:
+                responses = list(executor.map(fetch, range(2, last_page + 1)))
+
+            for page_response in responses:
+                if page_response.status_code != 200:
+                    print(f"❌ {error_label} olishda xatolik: {page_response.status_code}")
+                    break
+                pages.append(orjson.loads(page_response.content))
+
+        return pages
 
     def get_file_content(self, owner: str, repo: str, path: str, ref: str = 'main') -> Optional[str]:
-        """Faylning to'liq mazmunini olish"""
+        """
+        Faylning to'liq mazmunini olish
+
+        ETag bilan keshlanadi: qayta so'rovda If-None-Match yuboriladi,
+        304 Not Modified (rate limit sarflamaydi) bo'lsa keshdagi matn qaytadi.
+        """
+        cache_key = (owner, repo, path, ref)
+        with self._content_lock:
+            cached = self._content_cache.get(cache_key)
+
         url = f'{self.base_url}/repos/{owner}/{repo}/contents/{path}?ref={ref}'
-        response = self._make_request(url)
+        response = self._make_request(
+            url, extra_headers={'If-None-Match': cached[0]} if cached else None
+        )
+
+        if response.status_code == 304 and cached:
+            return cached[1]
 
         if response.status_code != 200:
             print(f"❌ File content olishda xatolik: {response.status_code} - {path}")
@@ -176,11 +531,17 @@ class GitHubClient:
         content = data.get('content', '')
         if content:
             try:
-                return base64.b64decode(content).decode('utf-8')
+                decoded = _decode_base64(content)
             except Exception as e:
                 print(f"⚠️ Decode xatolik: {e}")
                 return None
 
+            etag = response.headers.get('ETag')
+            if etag:
+                with self._content_lock:
+                    self._content_cache[cache_key] = (etag, decoded)
+            return decoded
+
         return None
 
     def get_file_content_by_sha(self, owner: str, repo: str, sha: str) -> Optional[str]:
@@ -188,7 +549,12 @@ class GitHubClient:
         🔥 YANGI: Blob API orqali fayl content olish
 
         Bu usul private repositorylar uchun ishlaydi!
+        Blob SHA o'zgarmas — decode qilingan matn xotira va diskda doimiy keshlanadi.
         """
+        cached = self._get_cached_blob(sha)
+        if cached is not None:
+            return cached
+
         url = f'{self.base_url}/repos/{owner}/{repo}/git/blobs/{sha}'
         response = self._make_request(url)
 
@@ -202,13 +568,63 @@ class GitHubClient:
             content_b64 = data.get('content', '')
             if content_b64:
                 try:
-                    return base64.b64decode(content_b64).decode('utf-8', errors='ignore')
+                    content = _decode_base64(content_b64)
                 except Exception as e:
                     print(f"⚠️ Blob decode xatolik: {e}")
                     return None
 
+                self._store_blob(sha, content)
+                return content
+
         return None
 
+    def _get_cached_blob(self, sha: str) -> Optional[str]:
+        """Blob'ni avval xotiradan, keyin diskdan olish"""
+        with self._content_lock:
+            cached = self._blob_cache.get(sha)
+        if cached is not None:
+            return cached
+
+        # Faqat haqiqiy SHA — aks holda path traversal (../) mumkin
+        if not _SHA_RE.fullmatch(sha):
+            return None
+
+        blob_file = BLOB_CACHE_DIR / sha
+        try:
+            content = blob_file.read_text(encoding='utf-8')
+            # mtime yangilanadi — pruning eng kam ishlatilganlarni o'chiradi
+            os.utime(blob_file)
+        except (OSError, ValueError):
+            return None
+
+        with self._content_lock:
+            self._blob_cache[sha] = content
+        return content
+
+    def _store_blob(self, sha: str, content: str):
+        """Blob'ni xotira va disk keshiga yozish (atomik: tmp + replace)"""
+        with self._content_lock:
+            self._blob_cache[sha] = content
+
+        if not _SHA_RE.fullmatch(sha):
+            return
+
+        try:
+            BLOB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = BLOB_CACHE_DIR / f'{sha}.{threading.get_ident()}.tmp'
+            tmp_file.write_text(content, encoding='utf-8')
+            os.replace(tmp_file, BLOB_CACHE_DIR / sha)
+        except OSError as e:
+            print(f"⚠️ Blob keshga yozib bo'lmadi: {e}")
+            return
+
+        global _blob_write_count
+        with _blob_prune_lock:
+            prune = _blob_write_count % _BLOB_PRUNE_EVERY == 0
+            _blob_write_count += 1
+        if prune:
+            _prune_blob_cache()
+
     def get_pr_diff(self, owner: str, repo: str, pr_number: int) -> Optional[str]:
         """PR ning to'liq diff'ini olish"""
         url = f'{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}'
@@ -228,12 +644,14 @@ class GitHubClient:
             return []
 
         commits = []
-        for c in response.json():
+        for c in orjson.loads(response.content):
+            commit = c.get('commit', {})
+            author = commit.get('author', {})
             commits.append({
                 'sha': c.get('sha', '')[:7],
-                'message': c.get('commit', {}).get('message', ''),
-                'author': c.get('commit', {}).get('author', {}).get('name', ''),
-                'date': c.get('commit', {}).get('author', {}).get('date', '')
+                'message': commit.get('message', ''),
+                'author': author.get('name', ''),
+                'date': author.get('date', '')
             })
 
         return commits
@@ -276,11 +694,208 @@ class GitHubClient:
         YANGI: Multi-strategy search!
         1. Title/body'da JIRA key bor PR'lar
         2. Branch name'da JIRA key bor PR'lar (head:branch-name)
+        3. Numeric part + verification
+        4. Numeric-only branch pattern'lar
+        5. Repo PR listing (last resort)
+
+        1-4 strategiyalar bitta GraphQL so'rovida yuboriladi; GraphQL ishlamasa
+        REST search/issues zanjiriga qaytiladi.
         """
         url = f"{self.base_url}/search/issues"
-        found_prs = []
+        numeric_part, prefix_part = self._extract_numeric_part(jira_key)
+
+        found_prs = self._search_prs_graphql(jira_key, numeric_part, prefix_part)
+        if found_prs is None:
+            found_prs = self._search_prs_rest(jira_key, numeric_part, prefix_part, url)
+
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # Strategy 5: Repo PR listing (last resort)
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        if not found_prs and numeric_part:
+            found_prs = self._search_by_repo_listing(jira_key, numeric_part)
+
+        # Final result
+        if found_prs:
+            print(f"   ✅ JAMI: {len(found_prs)} ta PR topildi!")
+        else:
+            print(f"   ❌ Hech qanday PR topilmadi")
+
+        return found_prs
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # STRATEGY 1-4: GraphQL (bitta round trip)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _search_prs_graphql(
+            self, jira_key: str, numeric_part: Optional[str], prefix_part: Optional[str]
+    ) -> Optional[List[Dict]]:
+        """
+        Strategy 1-4 ni bitta GraphQL so'rovida bajarish.
+
+        Har bir REST search so'rovi alohida alias'li search() node bo'ladi.
+        Natijalar REST zanjiri bilan bir xil ustuvorlikda tanlanadi, numeric
+        kandidatlar esa qaytgan headRefName/title/body bo'yicha lokal tekshiriladi
+        (qo'shimcha get_pr_info so'rovisiz).
+
+        Returns:
+            Topilgan PR'lar ro'yxati yoki None (GraphQL ishlamadi)
+        """
+        branch_patterns = self._branch_patterns(jira_key)
+        extended_patterns = self._extended_branch_patterns(numeric_part, prefix_part) if numeric_part else []
+
+        # alias -> (query, first)
+        searches = {'key': (f'org:{self.org} "{jira_key}" is:pr sort:updated-desc', 30)}
+        for i, pattern in enumerate(branch_patterns):
+            searches[f'branch{i}'] = (f'org:{self.org} head:{pattern} is:pr sort:updated-desc', 30)
+        if numeric_part:
+            searches['numeric'] = (f'org:{self.org} {numeric_part} is:pr sort:updated-desc', 10)
+        for i, pattern in enumerate(extended_patterns):
+            searches[f'ext{i}'] = (f'org:{self.org} head:{pattern} is:pr sort:updated-desc', 30)
+
+        var_defs = ', '.join(f'${alias}: String!' for alias in searches)
+        fields = '\n'.join(
+            f'  {alias}: search(query: ${alias}, type: ISSUE, first: {first}) {{ {_GRAPHQL_PR_NODES} }}'
+            for alias, (_, first) in searches.items()
+        )
+        query = f'query({var_defs}) {{\n{fields}\n}}'
+
+        print(f"   🔎 GitHub GraphQL search: {jira_key} ({len(searches)} queries, 1 request)")
+        data = self._graphql(query, {alias: q for alias, (q, _) in searches.items()})
+        if data is None:
+            print(f"   ⚠️ GraphQL search unavailable, REST fallback...")
+            return None
+
+        def nodes(alias: str) -> List[Dict]:
+            return [n for n in ((data.get(alias) or {}).get('nodes') or []) if n and n.get('url')]
+
+        # Strategy 1: title/body
+        items = nodes('key')
+        if items:
+            print(f"   ✅ Title/body search: {len(items)} ta topildi!")
+            return self._graphql_pr_entries(items, 'GitHub (title/body)')
+
+        # Strategy 2: branch name
+        for i, pattern in enumerate(branch_patterns):
+            items = nodes(f'branch{i}')
+            if items:
+                print(f"   ✅ Branch search: {len(items)} ta topildi (pattern: {pattern})!")
+                return self._graphql_pr_entries(items, f'GitHub (branch:{pattern})')
+
+        if not numeric_part:
+            return []
+
+        # Strategy 3: numeric part + verification
+        boundary_re = _numeric_boundary_re(numeric_part)
+        candidates = nodes('numeric')
+        print(f"   🔎 Numeric search: {len(candidates)} candidate(s) found, verifying...")
+        for node in candidates:
+            is_match, reason = self._match_ticket_fields(
+                node.get('headRefName') or '',
+                node.get('title') or '',
+                node.get('body') or '',
+                numeric_part, jira_key, boundary_re
+            )
+            if is_match:
+                print(f"   ✅ PR matched: {reason}")
+                return self._graphql_pr_entries([node], 'GitHub (numeric-search)')
+            print(f"   ⏭️  PR rejected: {reason}")
+
+        # Strategy 4: extended head: patterns
+        for i, pattern in enumerate(extended_patterns):
+            items = nodes(f'ext{i}')
+            if items:
+                print(f"   ✅ Extended branch: {len(items)} ta topildi (pattern: {pattern})!")
+                return self._graphql_pr_entries(items, f'GitHub (extended-branch:{pattern})')
+
+        print(f"   ⏭️  GraphQL search: nothing found")
+        return []
+
+    @staticmethod
+    def _graphql_pr_entries(nodes: List[Dict], source: str) -> List[Dict]:
+        """GraphQL PR node'larini REST search natijasi formatiga keltirish"""
+        found = []
+        seen = set()
+        for node in nodes:
+            pr_url = node['url']
+            if pr_url in seen:
+                continue
+            seen.add(pr_url)
+            # REST search 'open'/'closed' qaytaradi (merged ham 'closed')
+            state = (node.get('state') or '').lower()
+            found.append({
+                'url': pr_url,
+                'title': node.get('title'),
+                'status': 'closed' if state == 'merged' else state,
+                'source': source
+            })
+        return found
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # STRATEGY 1-4: REST fallback
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _search_prs_rest(
+            self, jira_key: str, numeric_part: Optional[str], prefix_part: Optional[str], url: str
+    ) -> List[Dict]:
+        """Strategy 1-4: REST search/issues (GraphQL ishlamaganda) — async pipeline'ning sync wrapper'i"""
+        return _run_sync(self._search_prs_rest_async(jira_key, numeric_part, prefix_part, url))
 
-        # Strategy 1: Search in title and body
+    async def _search_prs_rest_async(
+            self, jira_key: str, numeric_part: Optional[str], prefix_part: Optional[str], url: str
+    ) -> List[Dict]:
+        """
+        Strategy 1-4 ni bir vaqtda ishga tushirish.
+
+        Natija ketma-ket zanjir bilan bir xil: strategiyalar ustuvorlik tartibida
+        kutiladi, birinchi natijali strategiya g'olib. So'rovlar sinxron _make_request
+        (throttle, HTTP/2 client) orqali alohida thread'larda bajariladi.
+
+        Ishga tushgan thread'ni to'xtatib bo'lmaydi: g'olib topilgach `cancel` event'i
+        o'rnatiladi va qolgan strategiyalar navbatdagi so'rovdan oldin to'xtaydi
+        (search kvotasi — 30/min — va get_pr_info chaqiruvlari isrof qilinmaydi).
+        """
+        strategies = [
+            ("Title/body search", self._search_by_title_body, (jira_key, url)),
+            ("Branch search", self._search_by_branch_names, (jira_key, url)),
+        ]
+        if numeric_part:
+            strategies += [
+                ("Numeric search", self._search_by_numeric_part, (jira_key, numeric_part, url)),
+                ("Extended branch", self._search_extended_branch_patterns,
+                 (jira_key, numeric_part, prefix_part, url, self._branch_patterns(jira_key))),
+            ]
+
+        cancel = threading.Event()
+        loop = asyncio.get_running_loop()
+        # Alohida executor: to'xtatilgan strategiyalar asyncio.run yopilishini kutdirmaydi
+        executor = ThreadPoolExecutor(max_workers=len(strategies))
+        futures = [
+            loop.run_in_executor(executor, partial(fn, *args, cancel=cancel))
+            for _, fn, args in strategies
+        ]
+
+        try:
+            for (label, _, _), future in zip(strategies, futures):
+                try:
+                    found = await future
+                except Exception as e:
+                    print(f"   ⚠️ {label} exception: {e}")
+                    continue
+                if found:
+                    return found
+            return []
+        finally:
+            # Yutqazgan strategiyalar keyingi so'rovdan oldin to'xtaydi
+            cancel.set()
+            executor.shutdown(wait=False)
+
+    def _search_by_title_body(
+            self, jira_key: str, url: str, cancel: Optional[threading.Event] = None
+    ) -> List[Dict]:
+        """Strategy 1: Search in title and body"""
+        found_prs = []
+        if cancel is not None and cancel.is_set():
+            return found_prs
         query1 = f'org:{self.org} "{jira_key}" is:pr'
         print(f"   🔎 GitHub Search (title/body): {query1}")
 
@@ -304,78 +919,126 @@ class GitHubClient:
         except Exception as e:
             print(f"   ⚠️ Title/body search exception: {e}")
 
-        # Strategy 2: Search in branch names (if not found in title/body)
-        if not found_prs:
-            print(f"   🔎 Branch name search...")
-
-            # Common branch patterns
-            branch_patterns = [
-                jira_key,  # DEV-6959
-                jira_key.lower(),  # dev-6959
-                jira_key.replace('-', '_'),  # DEV_6959
-                f"feature/{jira_key}",  # feature/DEV-6959
-                f"bugfix/{jira_key}",  # bugfix/DEV-6959
-                f"fix/{jira_key}",  # fix/DEV-6959
-            ]
+        return found_prs
 
-            for pattern in branch_patterns:
-                query2 = f'org:{self.org} head:{pattern} is:pr'
+    def _search_by_branch_names(
+            self, jira_key: str, url: str, cancel: Optional[threading.Event] = None
+    ) -> List[Dict]:
+        """Strategy 2: Search in branch names"""
+        print(f"   🔎 Branch name search...")
+
+        items = self._search_branches(url, self._branch_patterns(jira_key), "Branch search", cancel)
+        if items:
+            print(f"   ✅ Branch search: {len(items)} ta topildi!")
+
+        return [
+            {
+                'url': item.get('html_url'),
+                'title': item.get('title'),
+                'status': item.get('state'),
+                'source': 'GitHub (branch)'
+            }
+            for item in items
+        ]
 
-                try:
-                    response2 = self._make_request(url, params={'q': query2, 'sort': 'updated'})
-
-                    if response2.status_code == 200:
-                        items = response2.json().get('items', [])
-                        for item in items:
-                            pr_url = item.get('html_url')
-                            # Avoid duplicates
-                            if not any(pr['url'] == pr_url for pr in found_prs):
-                                found_prs.append({
-                                    'url': pr_url,
-                                    'title': item.get('title'),
-                                    'status': item.get('state'),
-                                    'source': f'GitHub (branch:{pattern})'
-                                })
-
-                        # If found, break
-                        if items:
-                            print(f"   ✅ Branch search: {len(items)} ta topildi (pattern: {pattern})!")
-                            break
-                except Exception as e:
-                    print(f"   ⚠️ Branch search exception ({pattern}): {e}")
-                    continue
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # HELPER METHODS
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Strategy 3: Numeric part broad search + verification
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        numeric_part, prefix_part = self._extract_numeric_part(jira_key)
+    def _search_branches(
+            self,
+            search_url: str,
+            patterns: List[str],
+            label: str,
+            cancel: Optional[threading.Event] = None
+    ) -> List[Dict]:
+        """
+        head: pattern'larni OR bilan birlashtirib qidirish.
 
-        if not found_prs and numeric_part:
-            found_prs = self._search_by_numeric_part(jira_key, numeric_part, url)
+        org:{org} is:pr (head:p1 OR head:p2 OR ...) — har bir so'rovda ko'pi bilan
+        _MAX_OR_TERMS ta pattern. Guruhlar ro'yxat tartibida yuboriladi, birinchi
+        natijali guruhda to'xtaydi. cancel o'rnatilsa keyingi guruh yuborilmaydi.
 
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Strategy 4: Extended head: patterns (numeric-only)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        if not found_prs and numeric_part:
-            found_prs = self._search_extended_branch_patterns(jira_key, numeric_part, prefix_part, url)
+        Returns:
+            Search item'lar (html_url bo'yicha takrorsiz)
+        """
+        patterns = list(dict.fromkeys(patterns))
+        found = []
+        seen = set()
 
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Strategy 5: Repo PR listing (last resort)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        if not found_prs and numeric_part:
-            found_prs = self._search_by_repo_listing(jira_key, numeric_part)
+        for i in range(0, len(patterns), _MAX_OR_TERMS):
+            if cancel is not None and cancel.is_set():
+                break
+            chunk = patterns[i:i + _MAX_OR_TERMS]
+            query = f'org:{self.org} is:pr (' + ' OR '.join(f'head:{p}' for p in chunk) + ')'
 
-        # Final result
-        if found_prs:
-            print(f"   ✅ JAMI: {len(found_prs)} ta PR topildi!")
-        else:
-            print(f"   ❌ Hech qanday PR topilmadi")
+            try:
+                response = self._make_request(search_url, params={
+                    'q': query,
+                    'sort': 'updated',
+                    'advanced_search': 'true'
+                })
+            except Exception as e:
+                print(f"   ⚠️ {label} exception: {e}")
+                continue
 
-        return found_prs
+            if response.status_code != 200:
+                print(f"   ⚠️ {label} error: {response.status_code}")
+                continue
 
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # HELPER METHODS
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+            for item in response.json().get('items', []):
+                pr_url = item.get('html_url')
+                if pr_url not in seen:
+                    seen.add(pr_url)
+                    found.append(item)
+
+            if found:
+                break
+
+        return found
+
+    @staticmethod
+    def _branch_patterns(jira_key: str) -> List[str]:
+        """Strategy 2: JIRA key bilan keng tarqalgan branch nomlari"""
+        return [
+            jira_key,  # DEV-6959
+            jira_key.lower(),  # dev-6959
+            jira_key.replace('-', '_'),  # DEV_6959
+            f"feature/{jira_key}",  # feature/DEV-6959
+            f"bugfix/{jira_key}",  # bugfix/DEV-6959
+            f"fix/{jira_key}",  # fix/DEV-6959
+        ]
+
+    @staticmethod
+    def _extended_branch_patterns(numeric_part: str, prefix_part: Optional[str]) -> List[str]:
+        """
+        Strategy 4: numeric-only branch nomlari (tartib saqlangan, takrorsiz).
+
+        Covers cases like:
+        - 7068 (bare number)
+        - 7068b (number + letter suffix)
+        - fix/7068, feature/7068, etc.
+        - DEV7068 (prefix without hyphen)
+        """
+        prefix_clean = prefix_part.rstrip('-') if prefix_part else ''
+
+        patterns = [
+            numeric_part,                                    # 7068
+            f"{numeric_part}b",                              # 7068b
+            f"fix-{numeric_part}",                           # fix-7068
+            f"fix/{numeric_part}",                           # fix/7068
+            f"hotfix-{numeric_part}",                        # hotfix-7068
+            f"hotfix/{numeric_part}",                        # hotfix/7068
+            f"feature-{numeric_part}",                       # feature-7068
+            f"feature/{numeric_part}",                       # feature/7068
+            f"bugfix-{numeric_part}",                        # bugfix-7068
+            f"bugfix/{numeric_part}",                        # bugfix/7068
+            f"{prefix_clean}{numeric_part}",                 # DEV7068
+            f"{prefix_clean.lower()}{numeric_part}",         # dev7068
+        ]
+
+        # Deduplicate while preserving order
+        return list(dict.fromkeys(patterns))
 
     def _extract_numeric_part(self, jira_key: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -388,12 +1051,19 @@ class GitHubClient:
         Returns:
             (numeric_part, prefix_part) yoki (None, None)
         """
-        match = re.match(r'^([A-Z]+-?)(\d+)$', jira_key.strip().upper())
+        match = _JIRA_KEY_RE.match(jira_key.strip().upper())
         if match:
             return match.group(2), match.group(1)
         return None, None
 
-    def _verify_pr_for_ticket(self, pr_url: str, numeric_part: str, jira_key: str) -> Tuple[bool, str]:
+    def _verify_pr_for_ticket(
+            self,
+            pr_url: str,
+            numeric_part: str,
+            jira_key: str,
+            boundary_re: Optional[re.Pattern] = None,
+            search_item: Dict = None
+    ) -> Tuple[bool, str]:
         """
         PR URL'ni JIRA ticketga aloqadorligini tekshirish.
 
@@ -402,6 +1072,11 @@ class GitHubClient:
         2. title/body'da full jira_key (case-insensitive)
         3. title/body'da numeric_part with word-boundary isolation
 
+        boundary_re: oldindan compile qilingan word-boundary pattern
+        (bir nechta kandidat tekshirilganda qayta qurilmaydi)
+        search_item: search javobidagi item — title/body tekshiruvlari avval shu
+        bo'yicha bajariladi, faqat mos kelmasa get_pr_info (branch nomi) so'raladi
+
         Returns:
             (is_match, reason) — reason debug log uchun
         """
@@ -409,16 +1084,40 @@ class GitHubClient:
         if not all([owner, repo, pr_number]):
             return False, "URL parse failed"
 
+        # Arzon yo'l: search payload'dagi title/body (HTTP so'rovsiz)
+        if search_item is not None:
+            is_match, reason = self._match_ticket_fields(
+                '',
+                search_item.get('title') or '',
+                search_item.get('body') or '',
+                numeric_part, jira_key, boundary_re
+            )
+            if is_match:
+                return True, reason
+
         print(f"   🔍 Verifying PR #{pr_number} ({owner}/{repo})...")
 
         pr_info = self.get_pr_info(owner, repo, pr_number)
         if not pr_info:
             return False, "get_pr_info returned None"
 
-        head_branch = pr_info.get('head', '')
-        title = pr_info.get('title', '')
-        body = pr_info.get('body', '') or ''
-
+        return self._match_ticket_fields(
+            pr_info.get('head', ''),
+            pr_info.get('title', ''),
+            pr_info.get('body', '') or '',
+            numeric_part, jira_key, boundary_re
+        )
+
+    @staticmethod
+    def _match_ticket_fields(
+            head_branch: str,
+            title: str,
+            body: str,
+            numeric_part: str,
+            jira_key: str,
+            boundary_re: Optional[re.Pattern] = None
+    ) -> Tuple[bool, str]:
+        """_verify_pr_for_ticket tekshiruvlari (PR maydonlari allaqachon ma'lum bo'lganda)"""
         # Check 1: numeric_part in head branch name
         if numeric_part in head_branch:
             return True, f"branch '{head_branch}' contains '{numeric_part}'"
@@ -429,8 +1128,9 @@ class GitHubClient:
             return True, f"title/body contains '{jira_key}'"
 
         # Check 3: numeric_part with word-boundary ((?<!\d)7068(?!\d))
-        boundary_pattern = r'(?<!\d)' + re.escape(numeric_part) + r'(?!\d)'
-        if re.search(boundary_pattern, combined):
+        if boundary_re is None:
+            boundary_re = _numeric_boundary_re(numeric_part)
+        if boundary_re.search(combined):
             return True, f"title/body contains '{numeric_part}' (word-boundary)"
 
         return False, f"no match in branch '{head_branch}' or title/body"
@@ -439,7 +1139,13 @@ class GitHubClient:
     # STRATEGY 3: Numeric broad search + verification
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-    def _search_by_numeric_part(self, jira_key: str, numeric_part: str, search_url: str) -> List[Dict]:
+    def _search_by_numeric_part(
+            self,
+            jira_key: str,
+            numeric_part: str,
+            search_url: str,
+            cancel: Optional[threading.Event] = None
+    ) -> List[Dict]:
         """
         Strategy 3: Unquoted numeric search + post-filter verification.
 
@@ -447,6 +1153,8 @@ class GitHubClient:
         Then verify each candidate via get_pr_info() to avoid false positives.
         """
         found = []
+        if cancel is not None and cancel.is_set():
+            return found
         query = f'org:{self.org} {numeric_part} is:pr'
         print(f"   🔎 Numeric search: {query} (from {jira_key})")
 
@@ -464,12 +1172,20 @@ class GitHubClient:
             items = response.json().get('items', [])
             print(f"   🔎 Numeric search: {len(items)} candidate(s) found, verifying...")
 
+            boundary_re = _numeric_boundary_re(numeric_part)
+
             for item in items:
+                # Boshqa strategiya g'olib — qolgan get_pr_info tekshiruvlari kerak emas
+                if cancel is not None and cancel.is_set():
+                    return found
+
                 pr_url = item.get('html_url')
                 if not pr_url:
                     continue
 
-                is_match, reason = self._verify_pr_for_ticket(pr_url, numeric_part, jira_key)
+                is_match, reason = self._verify_pr_for_ticket(
+                    pr_url, numeric_part, jira_key, boundary_re, search_item=item
+                )
 
                 if is_match:
                     print(f"   ✅ PR matched: {reason}")
@@ -496,70 +1212,41 @@ class GitHubClient:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
     def _search_extended_branch_patterns(
-            self, jira_key: str, numeric_part: str, prefix_part: str, search_url: str
+            self,
+            jira_key: str,
+            numeric_part: str,
+            prefix_part: str,
+            search_url: str,
+            exclude: List[str] = None,
+            cancel: Optional[threading.Event] = None
     ) -> List[Dict]:
         """
-        Strategy 4: head: patterns using numeric-only branch names.
+        Strategy 4: head: patterns using numeric-only branch names (REST)
 
-        Covers cases like:
-        - 7068 (bare number)
-        - 7068b (number + letter suffix)
-        - fix/7068, feature/7068, etc.
-        - DEV7068 (prefix without hyphen)
+        exclude: Strategy 2 da allaqachon so'ralgan pattern'lar (qayta yuborilmaydi)
         """
         found = []
-        prefix_clean = prefix_part.rstrip('-') if prefix_part else ''
-
-        patterns = [
-            numeric_part,                                    # 7068
-            f"{numeric_part}b",                              # 7068b
-            f"fix-{numeric_part}",                           # fix-7068
-            f"fix/{numeric_part}",                           # fix/7068
-            f"hotfix-{numeric_part}",                        # hotfix-7068
-            f"hotfix/{numeric_part}",                        # hotfix/7068
-            f"feature-{numeric_part}",                       # feature-7068
-            f"feature/{numeric_part}",                       # feature/7068
-            f"bugfix-{numeric_part}",                        # bugfix-7068
-            f"bugfix/{numeric_part}",                        # bugfix/7068
-            f"{prefix_clean}{numeric_part}",                 # DEV7068
-            f"{prefix_clean.lower()}{numeric_part}",         # dev7068
+        excluded = set(exclude or ())
+        unique_patterns = [
+            p for p in self._extended_branch_patterns(numeric_part, prefix_part) if p not in excluded
         ]
 
-        # Deduplicate while preserving order
-        seen = set()
-        unique_patterns = []
-        for p in patterns:
-            if p not in seen:
-                seen.add(p)
-                unique_patterns.append(p)
-
         print(f"   🔎 Extended branch patterns (numeric): {len(unique_patterns)} patterns...")
 
-        for pattern in unique_patterns:
-            query = f'org:{self.org} head:{pattern} is:pr'
+        items = self._search_branches(search_url, unique_patterns, "Extended branch", cancel)
+        if cancel is not None and cancel.is_set():
+            return found
 
-            try:
-                response = self._make_request(search_url, params={'q': query, 'sort': 'updated'})
-
-                if response.status_code == 200:
-                    items = response.json().get('items', [])
-                    for item in items:
-                        pr_url = item.get('html_url')
-                        if not any(pr['url'] == pr_url for pr in found):
-                            found.append({
-                                'url': pr_url,
-                                'title': item.get('title'),
-                                'status': item.get('state'),
-                                'source': f'GitHub (extended-branch:{pattern})'
-                            })
-
-                    if items:
-                        print(f"   ✅ Extended branch: {len(items)} ta topildi (pattern: {pattern})!")
-                        break  # Found — stop trying patterns
+        for item in items:
+            found.append({
+                'url': item.get('html_url'),
+                'title': item.get('title'),
+                'status': item.get('state'),
+                'source': 'GitHub (extended-branch)'
+            })
 
-            except Exception as e:
-                print(f"   ⚠️ Extended branch exception ({pattern}): {e}")
-                continue
+        if items:
+            print(f"   ✅ Extended branch: {len(items)} ta topildi!")
 
         if not found:
             print(f"   ⏭️  Extended branch patterns: nothing found")
@@ -593,18 +1280,18 @@ class GitHubClient:
         Faqat 5 eng so'nggi repo tekshiriladi.
         """
         found = []
-        print(f"   🔎 Repo listing search (last resort): numeric '{numeric_part}' qidirilmoqda...")
+        logger.debug("🔎 Repo listing search (last resort): numeric '%s' qidirilmoqda...", numeric_part)
 
         try:
             repos = self._get_org_repos(max_repos=5)
             if not repos:
-                print(f"   ⚠️ Repo listing: no repos returned")
+                logger.warning("⚠️ Repo listing: no repos returned")
                 return found
 
             for repo_data in repos:
                 repo_name = repo_data.get('name', '')
                 owner = repo_data.get('owner', {}).get('login', self.org)
-                print(f"   🔍 Checking repo: {owner}/{repo_name}...")
+                logger.debug("🔍 Checking repo: %s/%s...", owner, repo_name)
 
                 try:
                     pr_list_url = f"{self.base_url}/repos/{owner}/{repo_name}/pulls"
@@ -615,7 +1302,7 @@ class GitHubClient:
                     })
 
                     if response.status_code != 200:
-                        print(f"   ⚠️ PR list error for {repo_name}: {response.status_code}")
+                        logger.warning("⚠️ PR list error for %s: %s", repo_name, response.status_code)
                         continue
 
                     prs = response.json()
@@ -623,7 +1310,10 @@ class GitHubClient:
                         head_ref = pr.get('head', {}).get('ref', '')
                         if numeric_part in head_ref:
                             pr_html_url = pr.get('html_url', '')
-                            print(f"   ✅ Found in {repo_name}: PR #{pr.get('number')} branch '{head_ref}' contains '{numeric_part}'")
+                            logger.debug(
+                                "✅ Found in %s: PR #%s branch '%s' contains '%s'",
+                                repo_name, pr.get('number'), head_ref, numeric_part
+                            )
                             found.append({
                                 'url': pr_html_url,
                                 'title': pr.get('title', ''),
@@ -633,16 +1323,16 @@ class GitHubClient:
                             break  # Found in this repo
 
                 except Exception as e:
-                    print(f"   ⚠️ Repo listing exception ({repo_name}): {e}")
+                    logger.warning("⚠️ Repo listing exception (%s): %s", repo_name, e)
                     continue
 
                 if found:
                     break  # Found — stop scanning repos
 
         except Exception as e:
-            print(f"   ⚠️ Repo listing search exception: {e}")
+            logger.warning("⚠️ Repo listing search exception: %s", e)
 
         if not found:
-            print(f"   ⏭️  Repo listing: checked repos, no match")
+            logger.debug("⏭️  Repo listing: checked repos, no match")
 
         return found
\ No newline at end of file
@@ -8,10 +8,163 @@ Version: 4.0 - UNIVERSAL
 """
 
 import re
-import base64
+import hashlib
 import requests
+import httpx
+import orjson
+import threading
+from cachetools import LRUCache
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
+from utils.github.github_client import GitHubClient, _decode_base64
+
+# Aho-Corasick (pyahocorasick) ixtiyoriy: o'rnatilmagan bo'lsa alternation regex ishlatiladi
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Contents/Blob API uchun raw media type (JSON + base64 o'rniga fayl baytlari)
+_RAW_ACCEPT = {'Accept': 'application/vnd.github.raw'}
+
+# Fayl kontenti keshi: (owner, repo, blob sha) -> content. Blob SHA o'zgarmas,
+# shuning uchun bir xil fayl boshqa PR/rebase'larda ham qayta yuklanmaydi
+_CONTENT_CACHE = LRUCache(maxsize=2048)
+_CONTENT_CACHE_LOCK = threading.Lock()
+_CONTENT_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
+# extract_context natijalari keshi: (filename, patch hash, content hash) -> context.
+# Natija faqat kirishlarga bog'liq — retry/qayta tahlilda regex ishi takrorlanmaydi
+_CONTEXT_CACHE = LRUCache(maxsize=512)
+_CONTEXT_CACHE_LOCK = threading.Lock()
+
+
+def _digest(text: str) -> bytes:
+    """Kesh kaliti uchun qisqa BLAKE2b hash (16 bayt)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+# get_file_content: muvaffaqiyatsiz javobdan keyingi qadam (_failure_action)
+_FETCH_NEXT = 'next'          # keyingi usulni sinash
+_FETCH_RAW_ONLY = 'raw_only'  # qolgan API usullari befoyda — faqat raw_url
+_FETCH_STOP = 'stop'          # hech bir usul yordam bermaydi
+
+
+# Fayl kengaytmasi → til
+_LANG_MAP = {
+    'py': 'python',
+    'js': 'javascript',
+    'jsx': 'javascript',
+    'ts': 'typescript',
+    'tsx': 'typescript',
+    'html': 'html',
+    'htm': 'html',
+    'sql': 'sql',
+    'pck': 'plsql',
+}
+
+# Til → markdown code block label
+_LANG_LABELS = {
+    'python': 'python',
+    'javascript': 'javascript',
+    'typescript': 'typescript',
+    'html': 'javascript',
+    'sql': 'sql',
+    'plsql': 'sql',
+}
+
+def _kw(word: str) -> str:
+    """SQL keyword uchun IGNORECASE'siz variantlar: (?:WORD|word|Word)"""
+    return f'(?:{word.upper()}|{word.lower()}|{word.capitalize()})'
+
+
+# Patch'dagi funksiya e'lonlari (til bo'yicha oldindan compile qilingan).
+# Butun patch matniga qo'llanadi: [^\S\n] — yangi qatordan boshqa bo'sh joy,
+# shuning uchun moslik bitta qatordan chiqmaydi.
+# Python/JS keyword'lari katta-kichik harfga sezgir — re.IGNORECASE ishlatilmaydi;
+# SQL keyword'lari esa aniq variantlar alternation'i bilan
+_PY_FUNC_RE = re.compile(r'def[^\S\n]+(\w+)[^\S\n]*\(')
+_JS_FUNC_RE = re.compile(r'function[^\S\n]+(\w+)[^\S\n]*\(')
+_SQL_FUNC_RE = re.compile(f"(?:{_kw('PROCEDURE')}|{_kw('FUNCTION')})" + r'[^\S\n]+(\w+)[^\S\n]*\(')
+
+# Diff header qatorlari (funksiya nomi qidirilmaydi)
+_PATCH_HEADER_PREFIXES = ('---', '+++', '@@')
+
+_PATCH_FUNC_PATTERNS = {
+    'python': _PY_FUNC_RE,
+    'javascript': _JS_FUNC_RE,
+    'typescript': _JS_FUNC_RE,
+    'html': _JS_FUNC_RE,
+    'sql': _SQL_FUNC_RE,
+    'plsql': _SQL_FUNC_RE,
+}
+
+# Full file'dagi signature shablonlari ({} — funksiya nomlari alternation'i).
+# Butun fayl matniga MULTILINE bilan qo'llanadi; \s o'rniga _WS ([^\S\n]) — moslik qatordan chiqmaydi
+_WS = r'[^\S\n]'
+_PY_SIG_TEMPLATE = (
+    r'^(' + _WS + r'*)(async' + _WS + r'+)?def' + _WS + r'+(?P<name>{})' + _WS + r'*\((.*?)\)'
+    r'(' + _WS + r'*->' + _WS + r'*[\w\[\], ]+)?:'
+)
+_JS_SIG_TEMPLATE = (
+    r'^' + _WS + r'*(async' + _WS + r'+)?function' + _WS + r'+(?P<name>{})' + _WS + r'*\((.*?)\)'
+)
+_SQL_SIG_TEMPLATE = (
+    r'^' + _WS + f"*(?:{_kw('CREATE')}" + _WS + f"+{_kw('OR')}" + _WS + f"+{_kw('REPLACE')}" + _WS
+    + f"+)?(?:{_kw('PROCEDURE')}|{_kw('FUNCTION')})" + _WS + r'+(?P<name>(?i:{}))' + _WS + r'*\((.*?)\)'
+)
+
+_SIG_TEMPLATES = {
+    'python': _PY_SIG_TEMPLATE,
+    'javascript': _JS_SIG_TEMPLATE,
+    'typescript': _JS_SIG_TEMPLATE,
+    'html': _JS_SIG_TEMPLATE,
+    'sql': _SQL_SIG_TEMPLATE,
+    'plsql': _SQL_SIG_TEMPLATE,
+}
+
+# SQL identifikatorlari katta-kichik harfga sezgir emas (nomlar lower() bilan solishtiriladi)
+_CASE_INSENSITIVE_LANGS = frozenset({'sql', 'plsql'})
+
+
+@lru_cache(maxsize=4096)
+def _compile_sig_pattern(lang: str, func_names: tuple) -> re.Pattern:
+    """(til, funksiya nomlari) uchun bitta birlashgan signature pattern (keshlangan)"""
+    names_alt = '|'.join(re.escape(name) for name in func_names)
+    return re.compile(_SIG_TEMPLATES[lang].format(names_alt), re.MULTILINE)
+
+
+@lru_cache(maxsize=1024)
+def _build_name_automaton(func_names: tuple):
+    """Funksiya nomlari uchun Aho-Corasick automaton (keshlangan)"""
+    automaton = ahocorasick.Automaton()
+    for name in func_names:
+        automaton.add_word(name, name)
+    automaton.make_automaton()
+    return automaton
+
+
+def _iter_automaton_matches(file_content: str, func_names: tuple, pattern: re.Pattern):
+    """
+    Fayl bir marta automaton bilan skan qilinadi; faqat nom uchragan qatorlar
+    signature pattern bilan (qator boshidan) tekshiriladi. Natija finditer bilan bir xil tartibda.
+    """
+    last_line_start = -1
+    for end, _name in _build_name_automaton(func_names).iter(file_content):
+        line_start = file_content.rfind('\n', 0, end) + 1
+        if line_start == last_line_start:
+            continue  # Shu qator allaqachon tekshirilgan
+        last_line_start = line_start
+
+        match = pattern.match(file_content, line_start)
+        if match:
+            yield match
+
 
 class SmartPatchHelper:
     """Smart Patch - Oddiy va ishonchli (with File Fetcher)"""
@@ -24,10 +177,26 @@ class SmartPatchHelper:
         ODDIY YONDASHUV:
         - Patch'dan funksiya nomlarini to'g'ridan-to'g'ri topamiz
         - Full file'dan signature'ni topamiz
+
+        Natija (filename, patch, full_file_content) BLAKE2b hash'lari bo'yicha keshlanadi.
         """
         if not patch or not full_file_content:
             return f"```diff\n{patch}\n```"
 
+        key = (filename, _digest(patch), _digest(full_file_content))
+        with _CONTEXT_CACHE_LOCK:
+            cached = _CONTEXT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        context = SmartPatchHelper._build_context(filename, patch, full_file_content)
+        with _CONTEXT_CACHE_LOCK:
+            _CONTEXT_CACHE[key] = context
+        return context
+
+    @staticmethod
+    def _build_context(filename: str, patch: str, full_file_content: str) -> str:
+        """extract_context'ning keshsiz asosiy qismi"""
         # Language detection
         lang = SmartPatchHelper._detect_language(filename)
 
@@ -44,59 +213,42 @@ class SmartPatchHelper:
         functions = SmartPatchHelper._find_function_signatures(
             full_file_content,
             function_names,
-            lang
+            lang,
+            limit=3
         )
 
-        # Format
-        output = []
+        # Count additions ('+' bilan boshlangan, '+++' header emas) — str.count C darajasida
+        additions = patch.count('\n+') - patch.count('\n+++')
+        if patch.startswith('+') and not patch.startswith('+++'):
+            additions += 1
+
+        changes_block = f"**Changes:** +{additions} lines\n```diff\n{patch}\n```"
 
-        if functions:
-            output.append("**📦 Affected Functions:**")
-            for func in functions[:3]:
-                output.append(f"- `{func['name']}` (line {func['line']})")
-                if func.get('signature'):
-                    lang_label = SmartPatchHelper._get_language_label(lang)
-                    output.append(f"  ```{lang_label}\n  {func['signature']}\n  ```")
-            output.append("")
+        if not functions:
+            return changes_block
 
-        # Count additions
-        additions = len([l for l in patch.split('\n') if l.startswith('+') and not l.startswith('+++')])
-        output.append(f"**Changes:** +{additions} lines")
-        output.append(f"```diff\n{patch}\n```")
+        # Format
+        lang_label = SmartPatchHelper._get_language_label(lang)
+        funcs_block = '\n'.join(
+            f"- `{func['name']}` (line {func['line']})"
+            + (f"\n  ```{lang_label}\n  {func['signature']}\n  ```" if func.get('signature') else '')
+            for func in functions
+        )
 
-        return '\n'.join(output)
+        return f"**📦 Affected Functions:**\n{funcs_block}\n\n{changes_block}"
 
     @staticmethod
     def _detect_language(filename: str) -> str:
         """Fayl tilini aniqlash"""
-        ext = filename.split('.')[-1].lower() if '.' in filename else ''
-
-        lang_map = {
-            'py': 'python',
-            'js': 'javascript',
-            'jsx': 'javascript',
-            'ts': 'typescript',
-            'tsx': 'typescript',
-            'html': 'html',
-            'htm': 'html',
-            'sql': 'sql',
-            'pck': 'plsql',
-        }
-
-        return lang_map.get(ext, 'unsupported')
+        _, dot, ext = filename.rpartition('.')
+        if not dot:
+            return 'unsupported'
+        return _LANG_MAP.get(ext.lower(), 'unsupported')
 
     @staticmethod
     def _get_language_label(lang: str) -> str:
         """Language label"""
-        labels = {
-            'python': 'python',
-            'javascript': 'javascript',
-            'typescript': 'typescript',
-            'html': 'javascript',
-            'sql': 'sql',
-            'plsql': 'sql',
-        }
-        return labels.get(lang, 'text')
+        return _LANG_LABELS.get(lang, 'text')
 
     @staticmethod
     def _extract_function_names_from_patch(patch: str, lang: str) -> List[str]:
@@ -105,66 +257,90 @@ class SmartPatchHelper:
 
         Bu eng oddiy va ishonchli usul!
         """
-        function_names = []
-
-        # Language-specific patterns
-        if lang in ['python']:
-            # def function_name(
-            pattern = r'def\s+(\w+)\s*\('
-        elif lang in ['javascript', 'typescript', 'html']:
-            # function functionName(
-            pattern = r'function\s+(\w+)\s*\('
-        elif lang in ['sql', 'plsql']:
-            # PROCEDURE procedure_name(
-            # FUNCTION function_name(
-            pattern = r'(?:PROCEDURE|FUNCTION)\s+(\w+)\s*\('
-        else:
+        # Language-specific pattern (oldindan compile qilingan)
+        pattern = _PATCH_FUNC_PATTERNS.get(lang)
+        if pattern is None:
             return []
 
-        # Patch'dan qidirish
-        for line in patch.split('\n'):
-            # Faqat context va added lines'dan qidirish
-            if line.startswith('---') or line.startswith('+++') or line.startswith('@@'):
-                continue
-
-            matches = re.findall(pattern, line, re.IGNORECASE)
-            function_names.extend(matches)
+        # Butun patch bo'yicha bitta finditer (qatorlarga bo'linmaydi);
+        # faqat context va added lines'dagi mosliklar olinadi
+        function_names = []
+        for match in pattern.finditer(patch):
+            line_start = patch.rfind('\n', 0, match.start()) + 1
+            if not patch.startswith(_PATCH_HEADER_PREFIXES, line_start):
+                function_names.append(match.group(1))
 
-        # Unique names
-        return list(set(function_names))
+        # Unique names (birinchi uchragan tartib saqlanadi — natija deterministik)
+        return list(dict.fromkeys(function_names))
 
     @staticmethod
-    def _find_function_signatures(file_content: str, function_names: List[str], lang: str) -> List[Dict]:
+    def _find_function_signatures(
+            file_content: str,
+            function_names: List[str],
+            lang: str,
+            limit: Optional[int] = None
+    ) -> List[Dict]:
         """
         Full file'dan funksiya signature'larini topish
+
+        file_content butun bufer sifatida ishlatiladi — split('\\n') qilinmaydi.
+        Barcha nomlar bitta alternation pattern'ga birlashtiriladi va fayl bir marta
+        o'qiladi (har bir nom uchun qayta skan qilinmaydi). Natija function_names tartibida.
+        pyahocorasick o'rnatilgan bo'lsa (Python/JS) nomlar automaton bilan topiladi va
+        pattern faqat o'sha qatorlarda tekshiriladi.
+
+        Ko'pi bilan MAX_FUNCTIONS_PER_FILE ta nom qidiriladi; limit berilsa natija
+        birinchi limit ta bilan cheklanadi va ular topilgan zahoti skan to'xtaydi.
         """
-        functions = []
+        function_names = function_names[:SmartPatchConfig.MAX_FUNCTIONS_PER_FILE]
+        if lang not in _SIG_TEMPLATES or not function_names:
+            return []
 
-        # Build pattern based on language
-        if lang == 'python':
-            pattern_template = r'^(\s*)(async\s+)?def\s+{}\s*\((.*?)\)(\s*->\s*[\w\[\], ]+)?:'
-        elif lang in ['javascript', 'typescript', 'html']:
-            pattern_template = r'^\s*(async\s+)?function\s+{}\s*\((.*?)\)'
-        elif lang in ['sql', 'plsql']:
-            pattern_template = r'^\s*(?:CREATE\s+OR\s+REPLACE\s+)?(?:PROCEDURE|FUNCTION)\s+{}\s*\((.*?)\)'
+        # Faqat SQL nomlari kichik harf bilan solishtiriladi; Python/JS — aniq holatda
+        fold = str.lower if lang in _CASE_INSENSITIVE_LANGS else str
+        wanted = {fold(name) for name in function_names}
+        names_key = tuple(sorted(wanted))
+        pattern = _compile_sig_pattern(lang, names_key)
+        # Shu nomlar topilsa natija aniq (limit bo'yicha birinchilar)
+        required = {fold(name) for name in function_names[:limit]} if limit else wanted
+
+        # Aho-Corasick faqat case-sensitive tillar uchun: SQL'da lower() offset'larni buzishi mumkin
+        if AHOCORASICK_AVAILABLE and lang not in _CASE_INSENSITIVE_LANGS:
+            matches = _iter_automaton_matches(file_content, names_key, pattern)
         else:
-            return []
+            matches = pattern.finditer(file_content)
+
+        # Qatorlar ro'yxati yaratilmaydi: moslik butun matn bo'yicha, qator raqami
+        # oldingi moslikdan boshlab str.count bilan hisoblanadi (mosliklar tartibli)
+        found = {}
+        counted_to, line_no = 0, 1
+        for match in matches:
+            key = fold(match.group('name'))
+            if key in found:
+                continue
 
-        lines = file_content.split('\n')
+            line_start = match.start()
+            line_end = file_content.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(file_content)
+            line_no += file_content.count('\n', counted_to, line_start)
+            counted_to = line_start
 
-        for func_name in function_names:
-            pattern = pattern_template.format(re.escape(func_name))
+            found[key] = (file_content[line_start:line_end].strip(), line_no)
+            if required <= found.keys():
+                break  # Kerakli hammasi topildi
 
-            for i, line in enumerate(lines, start=1):
-                if re.search(pattern, line, re.IGNORECASE):
-                    functions.append({
-                        'name': func_name,
-                        'signature': line.strip(),
-                        'line': i
-                    })
-                    break  # Found, next function
+        functions = []
+        for func_name in function_names:
+            hit = found.get(fold(func_name))
+            if hit:
+                functions.append({
+                    'name': func_name,
+                    'signature': hit[0],
+                    'line': hit[1]
+                })
 
-        return functions
+        return functions[:limit] if limit else functions
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # FILE CONTENT FETCHER - UNIVERSAL
@@ -174,7 +350,7 @@ class SmartPatchHelper:
     def get_file_content(
             pr: Dict,
             file_data: Dict,
-            github_session: requests.Session
+            github_client: GitHubClient
     ) -> Optional[str]:
         """
         GitHub dan fayl kontentini olish - UNIVERSAL
@@ -184,88 +360,153 @@ class SmartPatchHelper:
         2. blob API (fallback)
         3. raw_url (public repos)
 
+        401/403 da qolgan usullar sinalmaydi; 404 yoki rate limit tugaganda faqat
+        raw_url qoladi (_failure_action). Natija (owner, repo, sha) bo'yicha keshlanadi (blob SHA o'zgarmas).
+
         Args:
             pr: PR ma'lumotlari (owner, repo)
             file_data: File ma'lumotlari (sha, contents_url, raw_url)
-            github_session: GitHub API session (headers bilan)
+            github_client: GitHubClient — so'rovlar uning get() metodi orqali yuboriladi
+                (throttle, bir vaqtdagi so'rovlar semaforasi, rate limit hisobi; HTTP/2
+                mavjud bo'lsa fallback so'rovlar bitta ulanishda multiplex qilinadi)
 
         Returns:
             str: File content yoki None
         """
-        methods = [
-            lambda: SmartPatchHelper._try_contents_url(file_data, github_session),
-            lambda: SmartPatchHelper._try_blob_api(pr, file_data, github_session),
-            lambda: SmartPatchHelper._try_raw_url(file_data, github_session)
-        ]
+        owner = pr.get('owner')
+        repo = pr.get('repo')
+        file_sha = file_data.get('sha')
+
+        cache_key = (owner, repo, file_sha) if file_sha else None
+        if cache_key:
+            with _CONTENT_CACHE_LOCK:
+                cached = _CONTENT_CACHE.get(cache_key)
+                _CONTENT_CACHE_STATS['hits' if cached is not None else 'misses'] += 1
+            if cached is not None:
+                return cached
+
+        sources = (
+            # Method 1: Contents URL (most reliable)
+            (file_data.get('contents_url'), 'json_content'),
+            # Method 2: Blob API (fallback)
+            (f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{file_sha}"
+             if file_sha and owner and repo else None, 'json_blob'),
+            # Method 3: Raw URL (public repos)
+            (file_data.get('raw_url'), 'text'),
+        )
+
+        raw_only = False
+        for url, parser in sources:
+            if not url or (raw_only and parser != 'text'):
+                continue
 
-        for method in methods:
             try:
-                content = method()
-                if content:
-                    return content
-            except Exception as e:
-                # Silent fail, try next method
+                # Raw media type: JSON parse va base64 decode'siz to'g'ridan-to'g'ri baytlar
+                headers = None if parser == 'text' else _RAW_ACCEPT
+                response = github_client.get(url, headers=headers)
+                is_raw = True
+                if headers and response.status_code == 415:
+                    # Raw qo'llab-quvvatlanmasa — JSON + base64
+                    response = github_client.get(url)
+                    is_raw = False
+
+                if response.status_code != 200:
+                    action = SmartPatchHelper._failure_action(response)
+                    if action == _FETCH_STOP:
+                        break
+                    raw_only = raw_only or action == _FETCH_RAW_ONLY
+                    continue
+
+                if parser == 'text':
+                    content = response.text
+                elif is_raw:
+                    content = response.content.decode('utf-8', errors='ignore')
+                else:
+                    content = SmartPatchHelper._parse_b64_json(orjson.loads(response.content), parser)
+            except (requests.RequestException, httpx.HTTPError, ValueError):
+                # Tarmoq xatosi, 5xx retry'lari tugagan (RetryError), redirect/decode xatosi
+                # yoki buzilgan JSON — keyingi usul
                 continue
 
+            if content:
+                if cache_key:
+                    with _CONTENT_CACHE_LOCK:
+                        _CONTENT_CACHE[cache_key] = content
+                return content
+
         return None
 
     @staticmethod
-    def _try_contents_url(file_data: Dict, session: requests.Session) -> Optional[str]:
-        """Method 1: Contents URL (most reliable)"""
-        contents_url = file_data.get('contents_url')
-
-        if not contents_url:
-            return None
-
-        response = session.get(contents_url, timeout=30)
-
-        if response.status_code == 200:
-            content_data = response.json()
-
-            if 'content' in content_data:
-                content_b64 = content_data['content']
-                content_bytes = base64.b64decode(content_b64)
-                return content_bytes.decode('utf-8', errors='ignore')
+    def _failure_action(response) -> str:
+        """
+        200 bo'lmagan javobdan keyingi qadam
 
-        return None
+        - 401 yoki 403 (ruxsat yo'q): boshqa usullar ham shu token bilan yiqiladi — to'xtash
+        - 403/429 + X-RateLimit-Remaining: 0 yoki 404: API usullari befoyda — faqat raw_url
+          (raw.githubusercontent.com REST API limitiga kirmaydi)
+        - Boshqa (5xx va h.k.): keyingi usul
+        """
+        status = response.status_code
+        if status == 404:
+            return _FETCH_RAW_ONLY
+        if status in (403, 429):
+            if status == 429 or response.headers.get('X-RateLimit-Remaining') == '0':
+                return _FETCH_RAW_ONLY
+            return _FETCH_STOP
+        if status == 401:
+            return _FETCH_STOP
+        return _FETCH_NEXT
 
     @staticmethod
-    def _try_blob_api(pr: Dict, file_data: Dict, session: requests.Session) -> Optional[str]:
-        """Method 2: Blob API (fallback)"""
-        file_sha = file_data.get('sha')
-        owner = pr.get('owner')
-        repo = pr.get('repo')
-
-        if not (file_sha and owner and repo):
+    def _parse_b64_json(data: Dict, parser: str) -> Optional[str]:
+        """Contents/Blob API JSON javobidan base64 content'ni olish"""
+        if parser == 'json_blob' and data.get('encoding') != 'base64':
             return None
+        content_b64 = data.get('content')
+        return _decode_base64(content_b64) if content_b64 else None
 
-        blob_url = f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{file_sha}"
-        response = session.get(blob_url, timeout=30)
-
-        if response.status_code == 200:
-            blob_data = response.json()
-
-            if blob_data.get('encoding') == 'base64':
-                content_b64 = blob_data.get('content', '')
-                content_bytes = base64.b64decode(content_b64)
-                return content_bytes.decode('utf-8', errors='ignore')
-
-        return None
+    @staticmethod
+    def cache_info() -> Dict:
+        """Fayl kontenti keshi statistikasi (hits, misses, size, maxsize)"""
+        with _CONTENT_CACHE_LOCK:
+            return {
+                **_CONTENT_CACHE_STATS,
+                'size': len(_CONTENT_CACHE),
+                'maxsize': _CONTENT_CACHE.maxsize
+            }
 
     @staticmethod
-    def _try_raw_url(file_data: Dict, session: requests.Session) -> Optional[str]:
-        """Method 3: Raw URL (public repos)"""
-        raw_url = file_data.get('raw_url')
+    def get_file_contents_batch(
+            pr: Dict,
+            file_data_list: List[Dict],
+            github_client: GitHubClient,
+            max_workers: int = 5
+    ) -> List[Optional[str]]:
+        """
+        Bir nechta fayl kontentini parallel olish
 
-        if not raw_url:
-            return None
+        Har bir fayl get_file_content() bilan (3 xil usul) alohida thread'da olinadi.
+        Bir vaqtdagi so'rovlar baribir GitHubClient semaforasi bilan cheklanadi (5 ta),
+        shuning uchun workers soni ham shunga teng.
+
+        Bitta faylning xatosi faqat o'sha fayl uchun None beradi — qolganlari saqlanadi
+        (executor.map birinchi exception'ni qayta ko'taradi, shuning uchun har biri alohida ushlanadi).
 
-        response = session.get(raw_url, timeout=30)
+        Returns:
+            List: file_data_list tartibida content yoki None
+        """
+        if not file_data_list:
+            return []
 
-        if response.status_code == 200:
-            return response.text
+        def fetch(file_data: Dict) -> Optional[str]:
+            try:
+                return SmartPatchHelper.get_file_content(pr, file_data, github_client)
+            except Exception as e:
+                print(f"Smart Patch xatosi ({file_data.get('filename', '')}): {e}")
+                return None
 
-        return None
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_data_list))) as executor:
+            return list(executor.map(fetch, file_data_list))
 
 
 class SmartPatchConfig:
@@ -283,11 +524,13 @@ class SmartPatchConfig:
     @staticmethod
     def should_use_smart_patch(filename: str, file_count: int) -> bool:
         """Smart patch ishlatish kerakmi?"""
-        ext = '.' + filename.split('.')[-1] if '.' in filename else ''
-        if ext not in SmartPatchConfig.SUPPORTED_EXTENSIONS:
-            return False
-
         if file_count > SmartPatchConfig.MAX_SMART_FILES:
             return False
 
-        return True
\ No newline at end of file
+        # Kengaytma katta-kichik harfga sezgir (a.PY / X.SQL smart patch'ga tushmaydi)
+        _, dot, ext = filename.rpartition('.')
+        return bool(dot) and ext in _SUPPORTED_EXT_NODOT
+
+
+# Nuqtasiz kengaytmalar (rpartition natijasi bilan to'g'ridan-to'g'ri solishtirish uchun)
+_SUPPORTED_EXT_NODOT = frozenset(ext.lstrip('.') for ext in SmartPatchConfig.SUPPORTED_EXTENSIONS)
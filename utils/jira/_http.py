@@ -0,0 +1,57 @@
+# utils/jira/_http.py
+"""
+Jira REST uchun umumiy HTTP session
+
+JiraClient (Dev Status API) va JiraCommentWriter (ADF comment'lar) bitta Jira host'ga
+bir xil auth bilan murojaat qiladi — ular bitta pooled session'ni ishlatadi, shunda
+process'da bitta keep-alive ulanishlar puli bo'ladi.
+"""
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (email, token) -> session
+_sessions: Dict[Tuple[Optional[str], Optional[str]], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(email: Optional[str], token: Optional[str]) -> requests.Session:
+    """
+    Berilgan credential'lar uchun umumiy requests.Session (birinchi chaqiruvda yaratiladi)
+
+    Vaqtinchalik xatolar (ulanish/timeout, 429/5xx) faqat GET uchun 0.3*2^n kutib qayta
+    uriniladi; 429/503 dagi Retry-After hurmat qilinadi. POST qayta yuborilmaydi
+    (comment ikki marta yozilmasligi uchun). Urinishlar tugasa oxirgi javob qaytadi.
+    """
+    key = (email, token)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            session.auth = key
+            session.headers.update({
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            })
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset({'GET'}),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            )
+            session.mount('https://', adapter)
+            _sessions[key] = session
+    return session
@@ -11,14 +11,149 @@ Author: JASUR TURGUNOV
 Version: 1.0
 """
 import re
-from typing import Dict, List, Optional, Any
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Comment'lardagi "Vaqt:" formati
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# "##" + bo'lim emoji'si — bitta finditer bilan barcha sarlavha pozitsiyalari topiladi
+_HEADER_RE = re.compile(r'##\s*([✅⚠❌🐛🎨📊])')
+
+# Bo'lim → sarlavha emoji'si (bo'lim keyingi *boshqa* emoji sarlavhasigacha davom etadi)
+_SECTION_EMOJI = {
+    'completed': '✅',
+    'partial': '⚠',
+    'failed': '❌',
+    'issues': '🐛',
+    'figma': '🎨',
+}
+_EMOJI_SECTION = {emoji: key for key, emoji in _SECTION_EMOJI.items()}
+
+# Sarlavha matnini tekshirish (pozitsiyada .match); Score alohida ishlanadi
+_SECTION_HEADS = {
+    key: re.compile(src, re.IGNORECASE)
+    for key, src in {
+        'completed': r'##\s*✅\s*BAJARILGAN\s*TALABLAR?\s*',
+        'partial': r'##\s*⚠️?\s*QISMAN\s*BAJARILGAN\s*',
+        'failed': r'##\s*❌\s*BAJARILMAGAN\s*TALABLAR?\s*',
+        'issues': r'##\s*🐛\s*POTENSIAL\s*MUAMMOLAR?\s*',
+        'figma': r'##\s*🎨\s*FIGMA\s*DIZAYN\s*MOSLIGI?\s*',
+    }.items()
+}
+
+# Item marker'lari: "- ", "* ", "• " va/yoki "1. " (ikkalasi ketma-ket ham bo'lishi mumkin)
+_MARKER_RE = re.compile(r'(?:[-*•]\s*)?(?:\d+\.\s*)?')
+_BULLET_CHARS = frozenset('-*•')
+
+# Bo'lim "bo'sh" deb hisoblanadigan qiymatlar (kichik harfda solishtiriladi)
+_EMPTY_CONTENT = frozenset({"yo'q", 'yoq', '-', 'none', 'n/a'})
+_EMPTY_CONTENT_MAX_LEN = max(map(len, _EMPTY_CONTENT))
+
+# Moslik bali: "COMPLIANCE_SCORE: XX%" (bo'lmasa extract_compliance_score birinchi "XX%"ni oladi)
+_SCORE_TOKEN_RE = re.compile(r'COMPLIANCE_SCORE:\s*(\d+)%', re.IGNORECASE)
+
+# Moslik bali ranglari: (score >= 60) + (score >= 80) indeksi bo'yicha
+_SCORE_COLORS = (
+    "#FF5630",  # Red
+    "#FFAB00",  # Yellow/Orange
+    "#36B37E",  # Green
+)
+
+# Comment'dagi expand panel'lar tartibi (return notification'da faqat dastlabki uchtasi)
+_ALL_SECTIONS = ('completed', 'partial', 'failed', 'issues', 'figma')
+_ALL_SECTIONS_SET = frozenset(_ALL_SECTIONS)
+_RETURN_SECTIONS = ('completed', 'partial', 'failed')
+
+# O'zgarmas ADF node'lar: har chaqiruvda yangi dict yaratilmaydi.
+# Hujjatlar faqat JSON'ga serializatsiya qilinadi — bu node'lar o'zgartirilmasligi kerak
+_HARD_BREAK = {"type": "hardBreak"}
+_RULE = {"type": "rule"}
+
+
+def _split_items(content: str) -> List[str]:
+    """Matndan item'larni ajratib olish (-, *, •, 1. marker'larsiz)"""
+    items = []
+
+    # Bo'sh bo'lsa ("Yo'q", "None", "N/A" ham) — lower() faqat qisqa matnga
+    stripped = content.strip()
+    if not stripped or (len(stripped) <= _EMPTY_CONTENT_MAX_LEN and stripped.lower() in _EMPTY_CONTENT):
+        return items
 
-@dataclass
+    # Har bir qatorni tekshirish
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        # Marker'larni olib tashlash: -, *, •, 1., 2., etc.
+        # Regex faqat qator marker belgisi yoki raqam bilan boshlansa ishlatiladi
+        first = line[0]
+        if first in _BULLET_CHARS or first.isdecimal():
+            line = line[_MARKER_RE.match(line).end():].strip()
+
+        if len(line) > 2:
+            items.append(line)
+
+    return items
+
+
+@lru_cache(maxsize=128)
+def _section_bounds(ai_analysis: str) -> Dict[str, Tuple[int, int]]:
+    """
+    AI tahlildagi bo'limlar chegaralari: {section_key: (start, end)}
+
+    Bitta chiziqli skan (lazy .*? va lookahead'siz); natija matn bo'yicha keshlanadi.
+    Qaytarilgan dict o'zgartirilmasligi kerak.
+    """
+    # Sarlavha pozitsiyalari
+    headers = [(match.start(), match.group(1)) for match in _HEADER_RE.finditer(ai_analysis)]
+    positions = [pos for pos, _ in headers]
+
+    # Har bir bo'limning birinchi to'g'ri sarlavhasi → content boshlanishi
+    starts = {}
+    for pos, emoji in headers:
+        section_key = _EMOJI_SECTION.get(emoji)
+        if section_key is None or section_key in starts:
+            continue
+        head = _SECTION_HEADS[section_key].match(ai_analysis, pos)
+        if head:
+            starts[section_key] = head.end()
+
+    bounds = {}
+    for section_key, start in starts.items():
+        # Content keyingi boshqa emoji sarlavhasigacha (yoki matn oxirigacha)
+        own_emoji = _SECTION_EMOJI[section_key]
+        end = len(ai_analysis)
+        for idx in range(bisect_left(positions, start), len(headers)):
+            if headers[idx][1] != own_emoji:
+                end = headers[idx][0]
+                break
+        bounds[section_key] = (start, end)
+
+    return bounds
+
+
+@lru_cache(maxsize=512)
+def _section_items(ai_analysis: str, section_key: str) -> Tuple[str, ...]:
+    """
+    Bitta bo'lim item'lari (faqat so'ralgan bo'lim uchun hisoblanadi)
+
+    (matn, bo'lim) bo'yicha keshlanadi — comment va return notification bir xil
+    tahlilni qayta parse qilmaydi; o'zgarmas tuple qaytariladi.
+    """
+    start, end = _section_bounds(ai_analysis)[section_key]
+    # _split_items qatorlarni o'zi strip qiladi — bo'lim alohida strip qilinmaydi
+    return tuple(_split_items(ai_analysis[start:end]))
+
+
+@dataclass(slots=True)
 class AnalysisSection:
     """AI tahlil bo'limi"""
     title: str
@@ -32,15 +167,6 @@ class JiraADFFormatter:
 
     def __init__(self):
         """Initialize formatter"""
-        self.section_patterns = {
-            'completed': r'##\s*✅\s*BAJARILGAN\s*TALABLAR?\s*(.*?)(?=##\s*[⚠❌🐛🎨📊]|$)',
-            'partial': r'##\s*⚠️?\s*QISMAN\s*BAJARILGAN\s*(.*?)(?=##\s*[✅❌🐛🎨📊]|$)',
-            'failed': r'##\s*❌\s*BAJARILMAGAN\s*TALABLAR?\s*(.*?)(?=##\s*[✅⚠🐛🎨📊]|$)',
-            'issues': r'##\s*🐛\s*POTENSIAL\s*MUAMMOLAR?\s*(.*?)(?=##\s*[✅⚠❌🎨📊]|$)',
-            'figma': r'##\s*🎨\s*FIGMA\s*DIZAYN\s*MOSLIGI?\s*(.*?)(?=##\s*[✅⚠❌🐛📊]|$)',
-            'score': r'##\s*📊\s*MOSLIK\s*BALI?\s*(.*?)(?=##|$)'
-        }
-
         self.section_titles = {
             'completed': ('✅ Bajarilgan talablar', 'completed'),
             'partial': ('⚠️ Qisman bajarilgan', 'partial'),
@@ -62,39 +188,40 @@ class JiraADFFormatter:
 
     def _bold_text(self, text: str) -> Dict:
         """Bold text node"""
-        return self._text_node(text, [{"type": "strong"}])
+        return {"type": "text", "text": text, "marks": [{"type": "strong"}]}
 
     def _italic_text(self, text: str) -> Dict:
         """Italic text node"""
-        return self._text_node(text, [{"type": "em"}])
+        return {"type": "text", "text": text, "marks": [{"type": "em"}]}
 
     def _colored_text(self, text: str, color: str) -> Dict:
         """Rangli text node"""
-        return self._text_node(text, [{"type": "textColor", "attrs": {"color": color}}])
+        return {"type": "text", "text": text, "marks": [{"type": "textColor", "attrs": {"color": color}}]}
 
     def _paragraph(self, content: List[Dict]) -> Dict:
         """Paragraph node"""
         return {"type": "paragraph", "content": content}
 
     def _hard_break(self) -> Dict:
-        """Line break"""
-        return {"type": "hardBreak"}
+        """Line break (umumiy o'zgarmas node)"""
+        return _HARD_BREAK
 
     def _rule(self) -> Dict:
-        """Horizontal rule (chiziq)"""
-        return {"type": "rule"}
+        """Horizontal rule (chiziq) (umumiy o'zgarmas node)"""
+        return _RULE
 
     def _bullet_list(self, items: List[str]) -> Dict:
-        """Bullet list yaratish"""
-        list_items = []
-        for item in items:
-            list_items.append({
-                "type": "listItem",
-                "content": [
-                    self._paragraph([self._text_node(item)])
-                ]
-            })
-        return {"type": "bulletList", "content": list_items}
+        """Bullet list yaratish (listItem > paragraph > text bitta comprehension'da)"""
+        return {
+            "type": "bulletList",
+            "content": [
+                {
+                    "type": "listItem",
+                    "content": [{"type": "paragraph", "content": [{"type": "text", "text": item}]}]
+                }
+                for item in items
+            ]
+        }
 
     def _expand_panel(self, title: str, content: List[Dict]) -> Dict:
         """
@@ -148,10 +275,20 @@ class JiraADFFormatter:
     # AI ANALYSIS PARSER
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-    def parse_ai_analysis(self, ai_analysis: str) -> Dict[str, AnalysisSection]:
+    def parse_ai_analysis(
+            self,
+            ai_analysis: str,
+            section_keys: Optional[Iterable[str]] = None
+    ) -> Dict[str, AnalysisSection]:
         """
         AI tahlil natijasini bo'limlarga ajratish
 
+        Args:
+            ai_analysis: AI tahlil matni
+            section_keys: Faqat shu bo'limlar item'lari ajratiladi (None — hammasi)
+
+        Item'lari bo'sh bo'limlar natijaga kirmaydi.
+
         Returns:
             {
                 'completed': AnalysisSection(...),
@@ -160,64 +297,56 @@ class JiraADFFormatter:
                 'issues': AnalysisSection(...)
             }
         """
+        bounds = _section_bounds(ai_analysis)
+        wanted = _ALL_SECTIONS_SET if section_keys is None else frozenset(section_keys)
+
         sections = {}
+        for section_key in _SECTION_HEADS:
+            if section_key not in bounds or section_key not in wanted:
+                continue
 
-        for section_key, pattern in self.section_patterns.items():
-            if section_key == 'score':
-                continue  # Score alohida ishlanadi
+            # Item'siz bo'lim uchun AnalysisSection yaratilmaydi (panel baribir ko'rsatilmaydi)
+            items = _section_items(ai_analysis, section_key)
+            if not items:
+                continue
 
-            match = re.search(pattern, ai_analysis, re.DOTALL | re.IGNORECASE)
-            if match:
-                content = match.group(1).strip()
-                items = self._extract_items(content)
-
-                if section_key in self.section_titles:
-                    title, emoji = self.section_titles[section_key]
-                    sections[section_key] = AnalysisSection(
-                        title=title,
-                        emoji=emoji,
-                        items=items,
-                        section_type=section_key
-                    )
+            if section_key in self.section_titles:
+                title, emoji = self.section_titles[section_key]
+                sections[section_key] = AnalysisSection(
+                    title=title,
+                    emoji=emoji,
+                    items=list(items),
+                    section_type=section_key
+                )
 
         return sections
 
     def _extract_items(self, content: str) -> List[str]:
         """Matndan item'larni ajratib olish"""
-        items = []
-
-        # Bo'sh bo'lsa
-        if not content or content.strip() in ['yo\'q', 'yoq', '-', 'none', 'n/a']:
-            return items
-
-        # Har bir qatorni tekshirish
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Marker'larni olib tashlash: -, *, •, 1., 2., etc.
-            cleaned = re.sub(r'^[-*•]\s*', '', line)
-            cleaned = re.sub(r'^\d+\.\s*', '', cleaned)
-            cleaned = cleaned.strip()
-
-            if cleaned and len(cleaned) > 2:
-                items.append(cleaned)
-
-        return items
+        return _split_items(content)
 
     def extract_compliance_score(self, ai_analysis: str) -> Optional[int]:
         """Moslik balini ajratib olish"""
-        # Pattern 1: COMPLIANCE_SCORE: XX%
-        match = re.search(r'COMPLIANCE_SCORE:\s*(\d+)%', ai_analysis, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
+        # Ikkala pattern ham '%' talab qiladi
+        if '%' not in ai_analysis:
+            return None
 
-        # Pattern 2: **XX%** yoki XX%
-        match = re.search(r'\*?\*?(\d+)%\*?\*?', ai_analysis)
-        if match:
-            return int(match.group(1))
+        # Pattern 1: COMPLIANCE_SCORE: XX% (token bo'lmasa regex ishga tushmaydi)
+        if 'COMPLIANCE_SCORE' in ai_analysis or 'compliance_score' in ai_analysis.lower():
+            match = _SCORE_TOKEN_RE.search(ai_analysis)
+            if match:
+                return int(match.group(1))
+
+        # Pattern 2: **XX%** yoki XX% — birinchi raqamdan keyin turgan '%'
+        # (regex o'rniga str.find + orqaga raqamlarni yig'ish)
+        percent = ai_analysis.find('%')
+        while percent != -1:
+            start = percent
+            while start and ai_analysis[start - 1].isdecimal():
+                start -= 1
+            if start < percent:
+                return int(ai_analysis[start:percent])
+            percent = ai_analysis.find('%', percent + 1)
 
         return None
 
@@ -295,26 +424,24 @@ class JiraADFFormatter:
         Returns:
             ADF document (dict)
         """
-        from datetime import datetime
-
-        content = []
-
-        # ━━━ HEADER ━━━
-        content.append(self._heading("🎯 Avtomatik TZ-PR Moslik Tekshiruvi", 2))
-        content.append(self._rule())
-
         # ━━━ META INFO ━━━
         meta_text = [
             self._bold_text("Task: "),
             self._text_node(f"{result.task_key}"),
             self._hard_break(),
             self._bold_text("Vaqt: "),
-            self._text_node(datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+            self._text_node(datetime.now().strftime(_TIMESTAMP_FORMAT)),
             self._hard_break(),
             self._bold_text("Status: "),
             self._text_node(new_status)
         ]
-        content.append(self._paragraph(meta_text))
+
+        # ━━━ HEADER + META INFO ━━━
+        content = [
+            self._heading("🎯 Avtomatik TZ-PR Moslik Tekshiruvi", 2),
+            self._rule(),
+            self._paragraph(meta_text)
+        ]
 
         # ━━━ MOSLIK BALI ━━━
         if result.compliance_score is not None:
@@ -330,17 +457,18 @@ class JiraADFFormatter:
 
         # ━━━ RE-CHECK PANEL (task qaytarildigan so'ng yana tekshirilayotgan) ━━━
         if is_recheck and recheck_text:
-            content.append(self._panel([
-                self._paragraph([self._text_node(recheck_text)])
-            ], "note"))
-            content.append(self._rule())
+            content.extend((
+                self._panel([
+                    self._paragraph([self._text_node(recheck_text)])
+                ], "note"),
+                self._rule()
+            ))
 
         # ━━━ ZID COMMENTLAR PANEL (agar mavjud bo'lsa) ━━━
         if comment_analysis:
             contradictory_panel = self._build_contradictory_comments_panel(comment_analysis)
             if contradictory_panel:
-                content.append(contradictory_panel)
-                content.append(self._rule())
+                content.extend((contradictory_panel, self._rule()))
 
         # ━━━ STATISTIKA ━━━
         stats_items = [
@@ -349,33 +477,27 @@ class JiraADFFormatter:
             f"Qo'shilgan: +{result.total_additions}",
             f"O'chirilgan: -{result.total_deletions}"
         ]
-        content.append(self._heading("📈 Statistika", 3))
-        content.append(self._bullet_list(stats_items))
-        content.append(self._rule())
+        content.extend((
+            self._heading("📈 Statistika", 3),
+            self._bullet_list(stats_items),
+            self._rule()
+        ))
 
         # ━━━ AI TAHLIL BO'LIMLARI (EXPAND PANELS) ━━━
-        sections = self.parse_ai_analysis(result.ai_analysis)
-
-        # Faqat yoqilgan bo'limlarni ko'rsatish (token tejash sozlamasi)
-        _visible = visible_sections if visible_sections else [
-            'completed', 'partial', 'failed', 'issues', 'figma'
-        ]
-
-        for section_key in ['completed', 'partial', 'failed', 'issues', 'figma']:
-            if section_key not in _visible:
-                continue
-            if section_key in sections:
-                section = sections[section_key]
-                if section.items:
-                    # Expand panel title with count
-                    panel_title = f"{section.title} ({len(section.items)} ta)"
-
-                    # Panel ichidagi content
-                    panel_content = [self._bullet_list(section.items)]
-
-                    content.append(self._expand_panel(panel_title, panel_content))
-
-        content.append(self._rule())
+        # Faqat yoqilgan bo'limlarni ko'rsatish (token tejash sozlamasi) — yashirinlari parse qilinmaydi
+        _visible = frozenset(visible_sections) if visible_sections else _ALL_SECTIONS_SET
+        sections = self.parse_ai_analysis(result.ai_analysis, _visible)
+
+        # Expand panel: title'da item soni, ichida bullet list
+        content.extend(
+            self._expand_panel(f"{section.title} ({len(section.items)} ta)", [self._bullet_list(section.items)])
+            for section in (
+                sections.get(section_key)
+                for section_key in _ALL_SECTIONS
+                if section_key in _visible
+            )
+            if section and section.items
+        )
 
         # ━━━ FOOTER ━━━
         # footer_text parametr berilgan bo'lsa settings-dan, yo'q bo'lsa default
@@ -383,9 +505,12 @@ class JiraADFFormatter:
             "🤖 Bu komment AI tomonidan avtomatik yaratilgan. "
             "Savollar bo'lsa QA Team ga murojaat qiling."
         )
-        content.append(self._paragraph([
-            self._italic_text(actual_footer)
-        ]))
+        content.extend((
+            self._rule(),
+            self._paragraph([
+                self._italic_text(actual_footer)
+            ])
+        ))
 
         # ━━━ TO'LIQ DOCUMENT ━━━
         return {
@@ -419,27 +544,17 @@ class JiraADFFormatter:
         Returns:
             ADF document (dict)
         """
-        from datetime import datetime
-
-        content = []
-
-        # ━━━ HEADER ━━━
-        content.append(self._heading("🔄 Task Qaytarildi", 2))
-        content.append(self._rule())
-
         # ━━━ META INFO ━━━
         meta_text = [
             self._bold_text("Task: "),
             self._text_node(task_key),
             self._hard_break(),
             self._bold_text("Vaqt: "),
-            self._text_node(datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+            self._text_node(datetime.now().strftime(_TIMESTAMP_FORMAT)),
             self._hard_break(),
             self._bold_text("Qaytarish statusi: "),
             self._text_node(return_status)
         ]
-        content.append(self._paragraph(meta_text))
-        content.append(self._rule())
 
         # ━━━ WARNING PANEL ━━━
         score_color = self._get_score_color(compliance_score)
@@ -459,21 +574,26 @@ class JiraADFFormatter:
                 )
             ])
         ]
-        content.append(self._panel(panel_content, "warning"))
-        content.append(self._rule())
+
+        # ━━━ HEADER + META + WARNING PANEL ━━━
+        content = [
+            self._heading("🔄 Task Qaytarildi", 2),
+            self._rule(),
+            self._paragraph(meta_text),
+            self._rule(),
+            self._panel(panel_content, "warning"),
+            self._rule()
+        ]
 
         # ━━━ AI TAHLIL BO'LIMLARI (EXPAND PANELS) ━━━
         if ai_analysis:
-            sections = self.parse_ai_analysis(ai_analysis)
-
-            for section_key in ['completed', 'partial', 'failed']:
-                if section_key in sections:
-                    section = sections[section_key]
-                    if section.items:
-                        panel_title = f"{section.title} ({len(section.items)} ta)"
-                        panel_content_section = [self._bullet_list(section.items)]
-                        content.append(self._expand_panel(panel_title, panel_content_section))
+            sections = self.parse_ai_analysis(ai_analysis, _RETURN_SECTIONS)
 
+            content.extend(
+                self._expand_panel(f"{section.title} ({len(section.items)} ta)", [self._bullet_list(section.items)])
+                for section in (sections.get(section_key) for section_key in _RETURN_SECTIONS)
+                if section and section.items
+            )
             content.append(self._rule())
 
         # ━━━ FOOTER ━━━
@@ -488,13 +608,8 @@ class JiraADFFormatter:
         }
 
     def _get_score_color(self, score: int) -> str:
-        """Moslik bali uchun rang"""
-        if score >= 80:
-            return "#36B37E"  # Green
-        elif score >= 60:
-            return "#FFAB00"  # Yellow/Orange
-        else:
-            return "#FF5630"  # Red
+        """Moslik bali uchun rang (<60, 60-79, 80+)"""
+        return _SCORE_COLORS[(score >= 60) + (score >= 80)]
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # SIMPLE TEXT FORMAT (FALLBACK)
@@ -511,28 +626,27 @@ class JiraADFFormatter:
         Returns:
             Jira Markup string
         """
-        from datetime import datetime
-
         # Emoji va status
         status_emoji = "🎯" if "Ready" in new_status else "🧪"
 
-        comment = f"""
+        # Moslik bali (bo'lmasa bo'sh)
+        score_block = (
+            f"\n*📊 Moslik Bali:* *{result.compliance_score}%*\n"
+            if result.compliance_score is not None else ""
+        )
+
+        # Butun comment bitta f-string (ai_analysis += bilan qayta nusxalanmaydi)
+        return f"""
 {status_emoji} *Avtomatik TZ-PR Moslik Tekshiruvi*
 
 ----
 
 *Task:* {result.task_key}
-*Vaqt:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+*Vaqt:* {datetime.now().strftime(_TIMESTAMP_FORMAT)}
 *Status:* {new_status}
 
 ----
-"""
-
-        # Moslik bali
-        if result.compliance_score is not None:
-            comment += f"\n*📊 Moslik Bali:* *{result.compliance_score}%*\n"
-
-        comment += f"""
+{score_block}
 ----
 
 *📈 Statistika:*
@@ -551,7 +665,6 @@ class JiraADFFormatter:
 
 _Bu komment AI tomonidan avtomatik yaratilgan. Savollar bo'lsa QA Team ga murojaat qiling._
 """
-        return comment
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # ERROR COMMENTS
@@ -564,8 +677,6 @@ _Bu komment AI tomonidan avtomatik yaratilgan. Savollar bo'lsa QA Team ga muroja
             new_status: str
     ) -> Dict:
         """Xatolik uchun ADF document"""
-        from datetime import datetime
-
         content = [
             self._heading("⚠️ Avtomatik TZ-PR Tekshiruvi - Xatolik", 2),
             self._rule(),
@@ -574,7 +685,7 @@ _Bu komment AI tomonidan avtomatik yaratilgan. Savollar bo'lsa QA Team ga muroja
                 self._text_node(task_key),
                 self._hard_break(),
                 self._bold_text("Vaqt: "),
-                self._text_node(datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                self._text_node(datetime.now().strftime(_TIMESTAMP_FORMAT)),
                 self._hard_break(),
                 self._bold_text("Status: "),
                 self._text_node(new_status)
@@ -609,8 +720,6 @@ _Bu komment AI tomonidan avtomatik yaratilgan. Savollar bo'lsa QA Team ga muroja
             new_status: str
     ) -> Dict:
         """Kritik xatolik uchun ADF document"""
-        from datetime import datetime
-
         content = [
             self._heading("🚨 Avtomatik TZ-PR Tekshiruvi - Kritik Xatolik", 2),
             self._rule(),
@@ -619,7 +728,7 @@ _Bu komment AI tomonidan avtomatik yaratilgan. Savollar bo'lsa QA Team ga muroja
                 self._text_node(task_key),
                 self._hard_break(),
                 self._bold_text("Vaqt: "),
-                self._text_node(datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                self._text_node(datetime.now().strftime(_TIMESTAMP_FORMAT)),
                 self._hard_break(),
                 self._bold_text("Status: "),
                 self._text_node(new_status)
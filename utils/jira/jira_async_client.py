@@ -0,0 +1,237 @@
+# utils/jira/jira_async_client.py
+"""
+Async JIRA Client - ko'p task'ni parallel olish uchun
+
+JiraClient (sinxron) thread pool bilan ishlaydi; bu facade httpx.AsyncClient orqali
+barcha so'rovlarni bitta event loop'da bajaradi (h2 o'rnatilgan bo'lsa HTTP/2 —
+parallel so'rovlar bitta ulanishda multiplex qilinadi).
+
+Qaytariladigan dict'lar JiraClient.get_task_details bilan bir xil formatda.
+"""
+import asyncio
+import re
+from typing import Any, Dict, List, Optional
+
+import httpx
+import orjson
+
+from utils.jira.jira_client import _TASK_DETAIL_FIELDS
+from utils.jira.jira_figma_helper import JiraFigmaHelper
+
+# HTTP/2 (httpx[http2]) ixtiyoriy: h2 o'rnatilmagan bo'lsa HTTP/1.1 ishlatiladi
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_GITHUB_URL_RE = re.compile(r'https://github\.com/[^\s<>"\']+')
+
+
+def _name(value: Optional[Dict], attr: str, default: str) -> str:
+    """Jira JSON obyektidan nom olish (status/issuetype/assignee ...)"""
+    if not value:
+        return default
+    return value.get(attr, default)
+
+
+class AsyncJiraClient:
+    """
+    JIRA REST API bilan async ishlash
+
+    Misol:
+        async with AsyncJiraClient() as jira:
+            tasks = await jira.get_task_details_bulk(['DEV-1', 'DEV-2'])
+    """
+
+    def __init__(self):
+        from config.settings import settings
+
+        self.server = settings.JIRA_SERVER
+        self.email = settings.JIRA_EMAIL
+        self.token = settings.JIRA_API_TOKEN
+
+        # Custom fields
+        self.story_points_field = settings.STORY_POINTS_FIELD
+        self.pr_field = settings.PR_FIELD
+
+        # AsyncClient event loop'ga bog'lanadi — birinchi so'rovda (loop ichida) yaratiladi
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Lazy httpx.AsyncClient (basic auth, 10s timeout)"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                base_url=self.server,
+                auth=(self.email, self.token),
+                headers={'Accept': 'application/json'},
+                timeout=10,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=50)
+            )
+        return self._http_client
+
+    async def aclose(self):
+        """HTTP ulanishlarni yopish"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self) -> 'AsyncJiraClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def get_issue(
+            self,
+            issue_key: str,
+            fields: Optional[str] = None,
+            expand: Optional[str] = None
+    ) -> Optional[Dict]:
+        """Bitta issue ni olish (REST API v2 JSON)"""
+        params = {}
+        if fields:
+            params['fields'] = fields
+        if expand:
+            params['expand'] = expand
+
+        try:
+            response = await self.http_client.get(f"/rest/api/2/issue/{issue_key}", params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"❌ Issue olishda xatolik ({issue_key}): {e}")
+            return None
+
+    async def extract_pr_urls_dev_status(self, issue_key: str) -> List[Dict]:
+        """Development Status API dan PR URL olish"""
+        pr_urls = []
+
+        try:
+            response = await self.http_client.get(
+                "/rest/dev-status/1.0/issue/detail",
+                params={
+                    'issueId': issue_key,
+                    'applicationType': 'GitHub',
+                    'dataType': 'pullrequest'
+                }
+            )
+
+            if response.status_code == 200:
+                details = orjson.loads(response.content).get('detail', [])
+
+                if details:
+                    for pr in details[0].get('pullRequests', []):
+                        pr_url = pr.get('url', '')
+                        if pr_url and 'github.com' in pr_url:
+                            pr_urls.append({
+                                'url': pr_url,
+                                'title': pr.get('name', 'PR'),
+                                'status': pr.get('status', 'UNKNOWN'),
+                                'source': 'dev_status_api'
+                            })
+            else:
+                print(f"   ⚠️  Dev Status API ({issue_key}): HTTP {response.status_code}")
+
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"   ⚠️  Dev Status API error ({issue_key}): {e}")
+
+        return pr_urls
+
+    def extract_pr_urls_legacy(self, issue: Dict) -> List[Dict]:
+        """Legacy method: Custom PR field'dan qidirish"""
+        pr_field_value = issue.get('fields', {}).get(self.pr_field)
+        if not pr_field_value:
+            return []
+
+        return [
+            {'url': url, 'title': 'PR', 'status': 'UNKNOWN', 'source': 'custom_field'}
+            for url in _GITHUB_URL_RE.findall(str(pr_field_value))
+            if '/pull/' in url
+        ]
+
+    @staticmethod
+    def get_figma_links(description: str, comments: List[Dict]) -> List[Dict]:
+        """Yuklangan description va comment'lardan Figma link'larni olish (so'rovsiz)"""
+        links = JiraFigmaHelper.extract_figma_urls({'description': description, 'comments': comments})
+        return [
+            {
+                'url': link.url,
+                'file_key': link.file_key,
+                'name': link.name,
+                'source': link.source,
+                'author': link.author
+            }
+            for link in links
+        ]
+
+    async def get_task_details(self, issue_key: str) -> Optional[Dict]:
+        """Task ma'lumotlari (issue va Dev Status PR'lar parallel olinadi)"""
+        issue, pr_urls = await asyncio.gather(
+            self.get_issue(issue_key, fields=self._task_detail_fields()),
+            self.extract_pr_urls_dev_status(issue_key)
+        )
+        if not issue:
+            return None
+
+        return self._build_task_details(issue, pr_urls)
+
+    async def get_task_details_bulk(self, issue_keys: List[str]) -> Dict[str, Dict]:
+        """
+        Bir nechta task'ni parallel olish
+
+        Returns:
+            Dict[str, Dict]: issue_key -> task details (topilmagan key'lar kiritilmaydi)
+        """
+        keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys if key and key.strip()))
+        details = await asyncio.gather(*(self.get_task_details(key) for key in keys))
+
+        results = {key: task for key, task in zip(keys, details) if task}
+        print(f"✅ {len(results)}/{len(keys)} ta task ma'lumoti olindi (async)")
+        return results
+
+    def _task_detail_fields(self) -> str:
+        """get_task_details o'qiydigan field'lar (custom field'lar settings'dan)"""
+        return f"{_TASK_DETAIL_FIELDS},{self.story_points_field},{self.pr_field}"
+
+    def _build_task_details(self, issue: Dict, pr_urls: List[Dict]) -> Dict:
+        """Issue JSON va Dev Status PR'lardan task details dict yig'ish"""
+        fields: Dict[str, Any] = issue.get('fields', {})
+        description = fields.get('description') or ''
+
+        # Comments olish
+        comments = [
+            {
+                'author': _name(c.get('author'), 'displayName', 'Unknown'),
+                'body': c.get('body', ''),
+                'created': c.get('created', '')[:16].replace('T', ' ')
+            }
+            for c in (fields.get('comment') or {}).get('comments', [])
+        ]
+
+        if not pr_urls:
+            pr_urls = self.extract_pr_urls_legacy(issue)
+
+        created = fields.get('created')
+        resolved = fields.get('resolutiondate')
+
+        return {
+            'key': issue.get('key'),
+            'summary': fields.get('summary') or '',
+            'description': description,
+            'type': _name(fields.get('issuetype'), 'name', ''),
+            'status': _name(fields.get('status'), 'name', ''),
+            'assignee': _name(fields.get('assignee'), 'displayName', 'Unassigned'),
+            'reporter': _name(fields.get('reporter'), 'displayName', 'Unknown'),
+            'priority': _name(fields.get('priority'), 'name', 'None'),
+            'story_points': fields.get(self.story_points_field) or 0,
+            'comments': comments,
+            'pr_urls': pr_urls,
+            'figma_links': self.get_figma_links(description, comments),
+            'created': created[:10] if created else '',
+            'resolved': resolved[:10] if resolved else '',
+            'labels': list(fields.get('labels') or []),
+            'components': [c.get('name') for c in fields.get('components') or []]
+        }
@@ -7,14 +7,42 @@ YANGI:
 - ✅ Figma link'larni olish (NEW!)
 """
 from jira import JIRA
-from typing import Dict, List, Optional, Any
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Union
 import json
+import orjson
+import threading
 import requests
 
+from utils.jira import jira_issue_cache
+from utils.jira._http import get_session
+
+# So'rovlarda faqat o'qiladigan field'lar (Jira default'da barcha custom field'larni qaytaradi)
+_TASK_DETAIL_FIELDS = (
+    'summary,description,issuetype,status,assignee,reporter,priority,'
+    'comment,labels,components,created,resolutiondate,updated'
+)
+_TASK_LIST_FIELDS = 'summary,issuetype,status,assignee'
+_BUG_LIST_FIELDS = 'summary,status,priority,assignee'
+# get_task_details_bulk: bitta `key in (...)` JQL'dagi key'lar soni (JQL uzunligi cheklangan)
+_BULK_CHUNK_SIZE = 100
+
 
 class JiraClient:
     """JIRA API bilan ishlash"""
 
+    # Issue / Dev Status / Figma so'rovlari uchun umumiy thread pool (lazy, barcha instance'lar uchun)
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    # Javob keshlari (barcha instance'lar uchun umumiy): bitta tahlil davomida issue kam o'zgaradi.
+    # Comment/status yozilgandan keyin invalidate(issue_key) bilan tozalanadi
+    _issue_cache = TTLCache(maxsize=1024, ttl=60)       # (issue_key, expand, fields) -> issue
+    _dev_status_cache = TTLCache(maxsize=1024, ttl=60)  # issue_key -> PR'lar (bo'sh natija keshlanmaydi)
+    _figma_cache = TTLCache(maxsize=1024, ttl=60)       # issue_key -> Figma link'lar
+    _cache_lock = threading.Lock()
+
     def __init__(self):
         from config.settings import settings
 
@@ -28,17 +56,42 @@ class JiraClient:
         self.pr_field = settings.PR_FIELD
 
         self._client = None
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> JIRA:
-        """Lazy connection"""
+        """Lazy connection (thread-safe: get_task_details so'rovlari parallel)"""
         if self._client is None:
-            self._client = JIRA(
-                server=self.server,
-                basic_auth=(self.email, self.token)
-            )
+            with self._client_lock:
+                if self._client is None:
+                    self._client = JIRA(
+                        server=self.server,
+                        basic_auth=(self.email, self.token)
+                    )
         return self._client
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        REST so'rovlari uchun pooled session (Dev Status API)
+
+        JiraCommentWriter bilan umumiy (utils.jira._http) — bitta keep-alive ulanishlar puli.
+        """
+        return get_session(self.email, self.token)
+
+    def _task_detail_fields(self) -> str:
+        """get_task_details o'qiydigan field'lar (custom field'lar settings'dan)"""
+        return f"{_TASK_DETAIL_FIELDS},{self.story_points_field},{self.pr_field}"
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Umumiy thread pool (birinchi chaqiruvda yaratiladi)"""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='jira')
+        return cls._executor
+
     def test_connection(self) -> bool:
         """JIRA ulanishini tekshirish"""
         try:
@@ -49,44 +102,156 @@ class JiraClient:
             print(f"❌ JIRA ulanish xatosi: {e}")
             return False
 
-    def get_issue(self, issue_key: str, expand: str = 'changelog,renderedFields') -> Optional[Any]:
-        """Bitta issue ni olish"""
+    @classmethod
+    def invalidate(cls, issue_key: str):
+        """Issue keshlarini tozalash (issue'ga yozilgandan keyin)"""
+        with cls._cache_lock:
+            for cache_key in [k for k in cls._issue_cache if k[0] == issue_key]:
+                cls._issue_cache.pop(cache_key, None)
+            cls._dev_status_cache.pop(issue_key, None)
+            cls._figma_cache.pop(issue_key, None)
+
+    def get_issue(
+            self,
+            issue_key: str,
+            expand: Optional[str] = 'changelog,renderedFields',
+            fields: Optional[str] = None,
+            use_cache: bool = True
+    ) -> Optional[Any]:
+        """
+        Bitta issue ni olish (60 sekund keshlanadi)
+
+        fields berilsa faqat shu field'lar olinadi (None — barchasi).
+        use_cache=False — keshni o'qimasdan Jira'dan olish (natija keshga yoziladi).
+        """
+        cache_key = (issue_key, expand, fields)
+        if use_cache:
+            with self._cache_lock:
+                cached = self._issue_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            issue = self.client.issue(issue_key, expand=expand)
-            return issue
+            issue = self.client.issue(issue_key, fields=fields, expand=expand)
         except Exception as e:
             print(f"❌ Issue olishda xatolik: {e}")
             return None
 
+        with self._cache_lock:
+            self._issue_cache[cache_key] = issue
+        return issue
+
     def get_task_details(self, issue_key: str) -> Optional[Dict]:
         """
         Task ning asosiy ma'lumotlarini olish (TZ uchun)
 
         ✅ YANGI: figma_links field qo'shildi!
+
+        Issue va Dev Status PR'lar parallel olinadi (umumiy vaqt ≈ eng sekin so'rov,
+        yig'indisi emas). Figma link'lar shu issue'dan olinadi — qayta so'rov yo'q.
+
+        Natija (key, updated) bo'yicha diskda keshlanadi: avval faqat `updated` so'raladi,
+        issue o'zgarmagan bo'lsa to'liq issue olinmaydi. Dev Status PR'lar har doim yangidan.
+        `updated` va to'liq issue 60s xotira keshidan o'tkaziladi — webhook qayta tekshiruvi
+        (TZ tuzatilib status bir daqiqa ichida o'zgartirilganda) eski ma'lumot olmasin.
         """
-        issue = self.get_issue(issue_key)
+        executor = self._get_executor()
+        stamp_future = executor.submit(self._fetch_updated_stamp, issue_key)
+        pr_future = executor.submit(self.extract_pr_urls_dev_status, issue_key)
+
+        stamp = stamp_future.result()
+        if not stamp:
+            return None
+
+        # Jira qaytargan kanonik key (kichik harfli so'rov ham bitta yozuvga tushadi)
+        issue_key = stamp.key
+        cached = jira_issue_cache.get(issue_key, getattr(stamp.fields, 'updated', None))
+        if cached is not None:
+            # Dev Status bo'sh bo'lsa — keshdagi custom field PR'lari (issue bilan o'zgaradi)
+            cached['pr_urls'] = pr_future.result() or [
+                pr for pr in cached['pr_urls'] if pr.get('source') == 'custom_field'
+            ]
+            return cached
+
+        # Faqat ishlatiladigan field'lar (changelog/renderedFields kerak emas)
+        issue = self.get_issue(issue_key, None, self._task_detail_fields(), use_cache=False)
         if not issue:
             return None
 
+        details = self._build_task_details(issue, pr_future.result())
+        jira_issue_cache.put(issue.key, getattr(issue.fields, 'updated', None), details)
+        return details
+
+    def _fetch_updated_stamp(self, issue_key: str) -> Optional[Any]:
+        """Faqat `updated` field'ini to'g'ridan-to'g'ri Jira'dan olish (keshsiz)"""
+        try:
+            return self.client.issue(issue_key, fields='updated')
+        except Exception as e:
+            print(f"❌ Issue olishda xatolik: {e}")
+            return None
+
+    def get_task_details_bulk(self, issue_keys: List[str]) -> Dict[str, Dict]:
+        """
+        Bir nechta task'ning ma'lumotlarini olish (get_task_details'ning ro'yxat varianti)
+
+        Issue'lar N ta /issue/{key} o'rniga bitta `key in (...)` qidiruvida olinadi,
+        Dev Status (bulk endpoint yo'q) thread pool orqali parallel so'raladi,
+        Figma link'lar yuklangan description/comment'lardan — qo'shimcha so'rovsiz.
+
+        Returns:
+            Dict[str, Dict]: issue_key -> task details (topilmagan key'lar kiritilmaydi)
+        """
+        keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys if key and key.strip()))
+        if not keys:
+            return {}
+
+        executor = self._get_executor()
+        pr_futures = {key: executor.submit(self.extract_pr_urls_dev_status, key) for key in keys}
+
+        fields = self._task_detail_fields()
+        issues = {}
+        for start in range(0, len(keys), _BULK_CHUNK_SIZE):
+            chunk = keys[start:start + _BULK_CHUNK_SIZE]
+            try:
+                found = self.client.search_issues(
+                    f"key in ({','.join(chunk)})", maxResults=False, fields=fields
+                )
+            except Exception as e:
+                # Mavjud bo'lmagan key butun JQL'ni rad etadi — bu bo'lakni birma-bir olamiz
+                print(f"⚠️  Bulk qidiruv xatosi, alohida so'rovlarga o'tildi: {e}")
+                found = [issue for issue in executor.map(lambda k: self.get_issue(k, None, fields), chunk) if issue]
+
+            with self._cache_lock:
+                for issue in found:
+                    issues[issue.key] = issue
+                    self._issue_cache[(issue.key, None, fields)] = issue
+
+        results = {}
+        for key in keys:
+            issue = issues.get(key)
+            if issue is not None:
+                results[key] = self._build_task_details(issue, pr_futures[key].result())
+                jira_issue_cache.put(key, getattr(issue.fields, 'updated', None), results[key])
+
+        print(f"✅ {len(results)}/{len(keys)} ta task ma'lumoti olindi")
+        return results
+
+    def _build_task_details(self, issue: Any, pr_urls: List[Dict]) -> Dict:
+        """Yuklangan issue va Dev Status PR'lardan task details dict yig'ish"""
         fields = issue.fields
 
-        # Comments olish
-        comments = []
-        if hasattr(fields, 'comment') and hasattr(fields.comment, 'comments'):
-            for c in fields.comment.comments:
-                comments.append({
-                    'author': getattr(c.author, 'displayName', 'Unknown'),
-                    'body': c.body,
-                    'created': c.created[:16].replace('T', ' ')
-                })
+        # Comments olish (bir marta — Figma qidiruvi ham shu ro'yxatni ishlatadi)
+        comments = self._normalize_comments(issue)
 
         # PR URLs olish
-        pr_urls = self.extract_pr_urls_dev_status(issue_key)
         if not pr_urls:
             pr_urls = self.extract_pr_urls_legacy(issue)
 
-        # ✅ FIGMA INTEGRATION
-        figma_links = self.get_figma_links(issue_key)
+        # ✅ FIGMA INTEGRATION (yuklangan issue va comment'lar bilan)
+        figma_links = self.get_figma_links(issue, {
+            'description': fields.description or '',
+            'comments': comments
+        })
 
         return {
             'key': issue.key,
@@ -107,38 +272,61 @@ class JiraClient:
             'components': [c.name for c in fields.components] if fields.components else []
         }
 
-    def get_figma_links(self, issue_key: str) -> List[Dict]:
+    @staticmethod
+    def _normalize_comments(issue: Any) -> List[Dict]:
+        """Issue comment'larini [{'author', 'body', 'created'}] ko'rinishiga keltirish"""
+        comment_field = getattr(issue.fields, 'comment', None)
+        return [
+            {
+                'author': getattr(c.author, 'displayName', 'Unknown'),
+                'body': c.body,
+                'created': c.created[:16].replace('T', ' ')
+            }
+            for c in getattr(comment_field, 'comments', None) or []
+        ]
+
+    def get_figma_links(
+            self,
+            issue_or_key: Union[str, Any],
+            task_details: Optional[Dict] = None
+    ) -> List[Dict]:
         """
         ✅ YANGI METHOD: Task'dan Figma link'larni olish
 
+        Args:
+            issue_or_key: Issue key (issue API'dan olinadi) yoki yuklangan issue object
+            task_details: Tayyor {'description', 'comments'} (berilsa issue qayta parse qilinmaydi)
+
         Returns:
             List[Dict]: Figma link'lar ro'yxati
         """
+        # Faqat key bo'yicha chaqiruv keshlanadi (tayyor issue'dan olish faqat CPU ishi)
+        cache_key = issue_or_key if task_details is None and isinstance(issue_or_key, str) else None
+        if cache_key:
+            with self._cache_lock:
+                cached = self._figma_cache.get(cache_key)
+            if cached is not None:
+                return [dict(link) for link in cached]
+
         try:
             from utils.jira.jira_figma_helper import JiraFigmaHelper
 
-            # Get minimal task data
-            issue = self.get_issue(issue_key)
-            if not issue:
-                return []
-
-            task_details = {
-                'description': issue.fields.description or '',
-                'comments': []
-            }
+            if task_details is None:
+                # Get minimal task data
+                issue = self.get_issue(issue_or_key) if isinstance(issue_or_key, str) else issue_or_key
+                if not issue:
+                    return []
 
-            if hasattr(issue.fields, 'comment') and hasattr(issue.fields.comment, 'comments'):
-                for c in issue.fields.comment.comments:
-                    task_details['comments'].append({
-                        'author': getattr(c.author, 'displayName', 'Unknown'),
-                        'body': c.body
-                    })
+                task_details = {
+                    'description': issue.fields.description or '',
+                    'comments': self._normalize_comments(issue)
+                }
 
             # Extract Figma links
             figma_links_objs = JiraFigmaHelper.extract_figma_urls(task_details)
 
             # Convert to dict
-            return [
+            figma_links = [
                 {
                     'url': link.url,
                     'file_key': link.file_key,
@@ -148,13 +336,22 @@ class JiraClient:
                 }
                 for link in figma_links_objs
             ]
+            if cache_key:
+                with self._cache_lock:
+                    self._figma_cache[cache_key] = tuple(dict(link) for link in figma_links)
+            return figma_links
 
         except Exception as e:
             print(f"⚠️  Figma links error: {str(e)}")
             return []
 
     def extract_pr_urls_dev_status(self, issue_key: str) -> List[Dict]:
-        """Development Status API dan PR URL olish"""
+        """Development Status API dan PR URL olish (topilgan PR'lar 60 sekund keshlanadi)"""
+        with self._cache_lock:
+            cached = self._dev_status_cache.get(issue_key)
+        if cached is not None:
+            return [dict(pr) for pr in cached]
+
         pr_urls = []
 
         try:
@@ -165,15 +362,10 @@ class JiraClient:
                 'dataType': 'pullrequest'
             }
 
-            response = requests.get(
-                url,
-                auth=(self.email, self.token),
-                params=params,
-                timeout=10
-            )
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 details = data.get('detail', [])
 
                 if details and len(details) > 0:
@@ -191,10 +383,17 @@ class JiraClient:
                                 'status': pr.get('status', 'UNKNOWN'),
                                 'source': 'dev_status_api'
                             })
+            else:
+                print(f"   ⚠️  Dev Status API: HTTP {response.status_code} (qayta urinishlardan keyin)")
 
         except Exception as e:
             print(f"   ⚠️  Dev Status API error: {str(e)}")
 
+        # Bo'sh natija keshlanmaydi: PR hozirgina bog'langan bo'lishi mumkin
+        if pr_urls:
+            with self._cache_lock:
+                self._dev_status_cache[issue_key] = tuple(dict(pr) for pr in pr_urls)
+
         return pr_urls
 
     def extract_pr_urls_legacy(self, issue: Any) -> List[Dict]:
@@ -230,7 +429,8 @@ class JiraClient:
         """Sprint'dagi task'larni olish"""
         try:
             jql = f'Sprint = "{sprint_name}" ORDER BY created DESC'
-            issues = self.client.search_issues(jql, maxResults=500)
+            # maxResults=False: sprint'ning barcha sahifalari olinadi (faqat birinchisi emas)
+            issues = self.client.search_issues(jql, maxResults=False, fields=_TASK_LIST_FIELDS)
 
             results = []
             for issue in issues:
@@ -254,10 +454,11 @@ class JiraClient:
         try:
             if sprint_name:
                 jql = f'Sprint = "{sprint_name}" AND type = Bug ORDER BY created DESC'
+                # Sprint bilan cheklangan: barcha sahifalar olinadi
+                issues = self.client.search_issues(jql, maxResults=False, fields=_BUG_LIST_FIELDS)
             else:
                 jql = 'type = Bug AND status != Done ORDER BY created DESC'
-
-            issues = self.client.search_issues(jql, maxResults=500)
+                issues = self.client.search_issues(jql, maxResults=500, fields=_BUG_LIST_FIELDS)
 
             results = []
             for issue in issues:
@@ -279,7 +480,7 @@ class JiraClient:
     def search_tasks(self, jql: str, max_results: int = 100) -> List[Dict]:
         """JQL orqali qidirish"""
         try:
-            issues = self.client.search_issues(jql, maxResults=max_results)
+            issues = self.client.search_issues(jql, maxResults=max_results, fields=_TASK_LIST_FIELDS)
 
             results = []
             for issue in issues:
@@ -10,15 +10,23 @@ Version: 2.0 - ADF Support
 """
 from jira import JIRA
 import os
+import orjson
 import requests
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import logging
 
+from utils.jira._http import get_session
+from utils.jira.jira_client import JiraClient
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# add_comments_adf_bulk: parallel POST'lar soni (Jira'ni ortiqcha yuklamaslik uchun kichik)
+_BULK_WORKERS = 5
+
 
 class JiraCommentWriter:
     """JIRA ga comment yozish (ADF va oddiy format)"""
@@ -40,20 +48,10 @@ class JiraCommentWriter:
             logger.error(f"❌ JIRA connection failed: {e}")
             self.jira = None
 
-        # REST API session (ADF format uchun)
-        self._session = None
-
     @property
     def session(self) -> requests.Session:
-        """REST API session (lazy loading)"""
-        if self._session is None:
-            self._session = requests.Session()
-            self._session.auth = (self.email, self.api_token)
-            self._session.headers.update({
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            })
-        return self._session
+        """REST API session (ADF format uchun, JiraClient bilan umumiy pool)"""
+        return get_session(self.email, self.api_token)
 
     def add_comment_adf(self, task_key: str, adf_document: Dict) -> bool:
         """
@@ -75,9 +73,12 @@ class JiraCommentWriter:
                 "body": adf_document
             }
 
-            response = self.session.post(url, json=payload)
+            # orjson: dict-og'ir ADF daraxtini stdlib json'dan tezroq UTF-8 baytlarga aylantiradi
+            # (Content-Type: application/json session header'ida)
+            response = self.session.post(url, data=orjson.dumps(payload))
 
             if response.status_code == 201:
+                JiraClient.invalidate(task_key)
                 logger.info(f"✅ ADF Comment added to {task_key}")
                 return True
             else:
@@ -90,6 +91,34 @@ class JiraCommentWriter:
             logger.error(f"❌ ADF Comment error for {task_key}: {e}")
             return False
 
+    def add_comments_adf_bulk(self, items: List[Tuple[str, Dict]]) -> Dict[str, bool]:
+        """
+        Bir nechta task'ga ADF comment'larni parallel qo'shish
+
+        Umumiy pooled session (keep-alive) va kichik thread pool (5) — Jira'ni
+        ortiqcha yuklamaslik uchun.
+
+        Args:
+            items: [(task_key, adf_document), ...]
+
+        Returns:
+            {task_key: True/False} — bitta task'ga bir nechta comment bo'lsa,
+            hammasi yozilgandagina True (faqat False'larni qayta yuborish mumkin)
+        """
+        if not items:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=_BULK_WORKERS, thread_name_prefix='jira-comment') as executor:
+            outcomes = executor.map(lambda item: self.add_comment_adf(*item), items)
+
+            results: Dict[str, bool] = {}
+            for (task_key, _), ok in zip(items, outcomes):
+                results[task_key] = results.get(task_key, True) and ok
+
+        failed = sum(1 for ok in results.values() if not ok)
+        logger.info(f"ADF bulk: {len(results) - failed}/{len(results)} task'ga comment yozildi")
+        return results
+
     def add_comment(self, task_key: str, comment_text: str) -> bool:
         """
         Task ga comment qo'shish
@@ -108,6 +137,7 @@ class JiraCommentWriter:
         try:
             # Comment qo'shish
             self.jira.add_comment(task_key, comment_text)
+            JiraClient.invalidate(task_key)
 
             logger.info(f"✅ Comment added to {task_key}")
             return True
@@ -149,6 +179,7 @@ class JiraCommentWriter:
                 comment_text,
                 visibility=visibility
             )
+            JiraClient.invalidate(task_key)
 
             logger.info(f"✅ Restricted comment added to {task_key}")
             return True
@@ -3,24 +3,29 @@
 JIRA Figma Helper - JIRA task'lardan Figma link'larni olish
 """
 import re
-from typing import List, Dict
+from bisect import bisect_right
+from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+# Figma URL (group 1 — file key) va URL ichidagi fayl nomi
+_FIGMA_RE = re.compile(r'https://(?:www\.)?figma\.com/(?:file|proto|design)/([A-Za-z0-9]+)[^"\s<]*')
+_FIGMA_NAME_RE = re.compile(r'/(?:file|design|proto)/[A-Za-z0-9]+/([^?]+)')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FigmaLink:
-    """Figma link ma'lumotlari"""
+    """Figma link ma'lumotlari (o'zgarmas, __dict__'siz)"""
     url: str
     file_key: str
     name: str
     source: str
-    author: str = None
+    author: Optional[str] = None
 
 
 class JiraFigmaHelper:
     """JIRA'dan Figma link'larni topish"""
 
-    FIGMA_PATTERN = r'https://(?:www\.)?figma\.com/(?:file|proto|design)/([A-Za-z0-9]+)[^"\s<]*'
+    FIGMA_PATTERN = _FIGMA_RE
 
     @staticmethod
     def extract_figma_urls(task_details: Dict) -> List[FigmaLink]:
@@ -28,52 +33,43 @@ class JiraFigmaHelper:
         figma_links = []
         seen_file_keys = set()
 
-        # 1. Description
-        description = task_details.get('description', '')
-        if description:
-            matches = re.finditer(JiraFigmaHelper.FIGMA_PATTERN, description)
-
-            for match in matches:
-                url = match.group(0)
-                file_key = match.group(1)
-
-                if file_key in seen_file_keys:
-                    continue
-
-                seen_file_keys.add(file_key)
-                clean_url = url.replace('&amp;', '&').rstrip('<>')
-                name = JiraFigmaHelper._extract_name_from_url(clean_url)
-
+        # Description va barcha comment'lar bitta matnga qo'shiladi va bir marta skanerlanadi.
+        # '\n' ajratuvchi URL'ni keyingi blokka o'tkazib yubormaydi ([^"\s<] da to'xtaydi)
+        comments = task_details.get('comments', [])
+        blobs = [task_details.get('description', '') or '']
+        blobs.extend(comment.get('body', '') for comment in comments)
+
+        # Har bir blok boshlanish offset'i -> bisect bilan match manbasini topish
+        offsets = []
+        position = 0
+        for blob in blobs:
+            offsets.append(position)
+            position += len(blob) + 1
+
+        for match in _FIGMA_RE.finditer('\n'.join(blobs)):
+            file_key = match.group(1)
+            if file_key in seen_file_keys:
+                continue
+
+            seen_file_keys.add(file_key)
+            clean_url = match.group(0).replace('&amp;', '&').rstrip('<>')
+            name = JiraFigmaHelper._extract_name_from_url(clean_url)
+
+            blob_index = bisect_right(offsets, match.start()) - 1
+            if blob_index == 0:
                 figma_links.append(FigmaLink(
                     url=clean_url,
                     file_key=file_key,
                     name=name,
                     source='description'
                 ))
-
-        # 2. Comments
-        comments = task_details.get('comments', [])
-        for comment in comments:
-            comment_body = comment.get('body', '')
-            matches = re.finditer(JiraFigmaHelper.FIGMA_PATTERN, comment_body)
-
-            for match in matches:
-                url = match.group(0)
-                file_key = match.group(1)
-
-                if file_key in seen_file_keys:
-                    continue
-
-                seen_file_keys.add(file_key)
-                clean_url = url.replace('&amp;', '&').rstrip('<>')
-                name = JiraFigmaHelper._extract_name_from_url(clean_url)
-
+            else:
                 figma_links.append(FigmaLink(
                     url=clean_url,
                     file_key=file_key,
                     name=name,
                     source='comment',
-                    author=comment.get('author', 'Unknown')
+                    author=comments[blob_index - 1].get('author', 'Unknown')
                 ))
 
         return figma_links
@@ -81,8 +77,7 @@ class JiraFigmaHelper:
     @staticmethod
     def _extract_name_from_url(url: str) -> str:
         """Extract file name from URL"""
-        pattern = r'/(?:file|design|proto)/[A-Za-z0-9]+/([^?]+)'
-        match = re.search(pattern, url)
+        match = _FIGMA_NAME_RE.search(url)
 
         if match:
             name = match.group(1)
@@ -0,0 +1,83 @@
+# utils/jira/jira_issue_cache.py
+"""
+Jira task details disk keshi
+
+get_task_details natijasi (key, updated) bo'yicha SQLite'da saqlanadi: issue o'zgarmagan
+bo'lsa qayta tahlil (AI scoring, ADF ishlab chiqish) to'liq Jira so'rovisiz ishlaydi.
+Payload — zlib bilan siqilgan orjson.
+"""
+import logging
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / 'data'
+CACHE_FILE = CACHE_DIR / 'jira_issue_cache.db'
+
+_initialized = False
+_init_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """Kesh DB ga ulanish (jadval birinchi chaqiruvda yaratiladi)"""
+    global _initialized
+    if not _initialized:
+        with _init_lock:
+            if not _initialized:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(CACHE_FILE, timeout=5)
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS issue_cache ("
+                        "key TEXT PRIMARY KEY, updated TEXT NOT NULL, payload BLOB NOT NULL)"
+                    )
+                    conn.commit()
+                finally:
+                    conn.close()
+                _initialized = True
+    return sqlite3.connect(CACHE_FILE, timeout=5)
+
+
+def get(issue_key: str, updated: Optional[str]) -> Optional[Dict]:
+    """Keshdagi task details (faqat saqlangan updated mos kelsa)"""
+    if not updated:
+        return None
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT payload FROM issue_cache WHERE key = ? AND updated = ?",
+                (issue_key, updated)
+            ).fetchone()
+        finally:
+            conn.close()
+        return orjson.loads(zlib.decompress(row[0])) if row else None
+    except (sqlite3.Error, zlib.error, orjson.JSONDecodeError) as e:
+        logger.warning(f"Issue cache read error ({issue_key}): {e}")
+        return None
+
+
+def put(issue_key: str, updated: Optional[str], details: Dict) -> None:
+    """Task details ni saqlash (eski yozuv almashtiriladi; updated bo'lmasa saqlanmaydi)"""
+    if not updated:
+        return
+    try:
+        payload = zlib.compress(orjson.dumps(details))
+        conn = _connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO issue_cache (key, updated, payload) VALUES (?, ?, ?)",
+                (issue_key, updated, payload)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except (sqlite3.Error, TypeError) as e:
+        logger.warning(f"Issue cache write error ({issue_key}): {e}")
@@ -16,6 +16,8 @@ from typing import List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 import logging
 
+from utils.jira.jira_client import JiraClient
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -144,6 +146,7 @@ class JiraStatusManager:
                 )
             else:
                 self.jira.transition_issue(task_key, transition_id)
+            JiraClient.invalidate(task_key)
 
             logger.info(f"✅ {task_key} → {new_status}")
             return True, f"Status o'zgartirildi: {new_status}"